@@ -11,6 +11,15 @@ import json
 import os
 from ..utils.config import config
 
+# Health score bands per metric as (low, high, score); the first band
+# containing the value wins, the last band is the catch-all
+HEALTH_SCORE_BANDS = {
+    'bmi': ((18.5, 25, 85), (25, 30, 70), (float('-inf'), float('inf'), 50)),
+    'resting_hr': ((60, 80, 85), (50, 90, 70), (float('-inf'), float('inf'), 50)),
+    'steps': ((10000, float('inf'), 90), (7500, float('inf'), 75),
+              (5000, float('inf'), 60), (float('-inf'), float('inf'), 40)),
+}
+
 def get_health_data(method: str, days: int = 30) -> pd.DataFrame:
     """
     Get health data for a specific method from the last N days.
@@ -325,10 +334,38 @@ def get_bmi_category(bmi: float) -> str:
     else:
         return 'Obese'
 
-def get_health_score() -> Dict[str, Any]:
+def get_band_score(value: float, bands: Tuple[Tuple[float, float, int], ...]) -> int:
+    """
+    Map a metric value to a score using a table of bands.
+    
+    Args:
+        value: Metric value
+        bands: Ordered (low, high, score) bands, bounds inclusive
+    
+    Returns:
+        Score of the first band containing the value, or 0 if none does.
+        NaN gets the score of the last (catch-all) band
+    """
+    if np.isnan(value):
+        # NaN fails every bound comparison; score it like the catch-all band
+        return bands[-1][2]
+    
+    for low, high, score in bands:
+        if low <= value <= high:
+            return score
+    return 0
+
+def get_health_score(body_metrics: Optional[Dict[str, Any]] = None,
+                     vital_metrics: Optional[Dict[str, Any]] = None,
+                     fitness_metrics: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Calculate an overall health score based on available metrics.
     
+    Args:
+        body_metrics: Precomputed body composition metrics, calculated if omitted
+        vital_metrics: Precomputed vital signs metrics, calculated if omitted
+        fitness_metrics: Precomputed fitness metrics, calculated if omitted
+    
     Returns:
         Dictionary with health score and breakdown
     """
@@ -342,41 +379,27 @@ def get_health_score() -> Dict[str, Any]:
     # This is a simplified scoring system
     # In a real application, you'd use medical guidelines and algorithms
     
-    body_metrics = calculate_body_composition_metrics()
-    vital_metrics = calculate_vital_signs_metrics()
-    fitness_metrics = calculate_fitness_metrics()
+    if body_metrics is None:
+        body_metrics = calculate_body_composition_metrics()
+    if vital_metrics is None:
+        vital_metrics = calculate_vital_signs_metrics()
+    if fitness_metrics is None:
+        fitness_metrics = calculate_fitness_metrics()
     
     # Body composition score (0-100)
     if body_metrics['bmi']['current']:
-        bmi = body_metrics['bmi']['current']
-        if 18.5 <= bmi <= 25:
-            score_components['body_composition'] = 85
-        elif 25 < bmi <= 30:
-            score_components['body_composition'] = 70
-        else:
-            score_components['body_composition'] = 50
+        score_components['body_composition'] = get_band_score(
+            body_metrics['bmi']['current'], HEALTH_SCORE_BANDS['bmi'])
     
     # Cardiovascular score (0-100)
     if vital_metrics['heartRate']['resting']:
-        rhr = vital_metrics['heartRate']['resting']
-        if 60 <= rhr <= 80:
-            score_components['cardiovascular'] = 85
-        elif 50 <= rhr <= 90:
-            score_components['cardiovascular'] = 70
-        else:
-            score_components['cardiovascular'] = 50
+        score_components['cardiovascular'] = get_band_score(
+            vital_metrics['heartRate']['resting'], HEALTH_SCORE_BANDS['resting_hr'])
     
     # Fitness score (0-100)
     if fitness_metrics['steps']['daily_avg']:
-        steps = fitness_metrics['steps']['daily_avg']
-        if steps >= 10000:
-            score_components['fitness'] = 90
-        elif steps >= 7500:
-            score_components['fitness'] = 75
-        elif steps >= 5000:
-            score_components['fitness'] = 60
-        else:
-            score_components['fitness'] = 40
+        score_components['fitness'] = get_band_score(
+            fitness_metrics['steps']['daily_avg'], HEALTH_SCORE_BANDS['steps'])
     
     # Overall score
     scores = [v for v in score_components.values() if v > 0]
@@ -392,10 +415,14 @@ def get_comprehensive_health_data() -> Dict[str, Any]:
     Returns:
         Complete health data dictionary
     """
+    body_metrics = calculate_body_composition_metrics()
+    vital_metrics = calculate_vital_signs_metrics()
+    fitness_metrics = calculate_fitness_metrics()
+    
     return {
-        'body_composition': calculate_body_composition_metrics(),
-        'vital_signs': calculate_vital_signs_metrics(),
-        'fitness': calculate_fitness_metrics(),
-        'health_score': get_health_score(),
+        'body_composition': body_metrics,
+        'vital_signs': vital_metrics,
+        'fitness': fitness_metrics,
+        'health_score': get_health_score(body_metrics, vital_metrics, fitness_metrics),
         'generated_at': datetime.now().isoformat()
     }
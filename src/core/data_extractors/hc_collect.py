@@ -402,3 +402,18 @@ def get_all_methods_status() -> Dict[str, Dict[str, Any]]:
         }
     
     return status
+
+def get_all_methods_status_df() -> pd.DataFrame:
+    """
+    Get status information for all methods as a DataFrame.
+    
+    Returns:
+        DataFrame with one row per method and columns
+        method, has_data, record_count, last_update
+    """
+    status = get_all_methods_status()
+    
+    return pd.DataFrame(
+        [{"method": method, **info} for method, info in status.items()],
+        columns=["method", "has_data", "record_count", "last_update"]
+    ).astype({"has_data": bool, "record_count": int})
@@ -6,17 +6,18 @@ Frontend interface for the personal dashboard application.
 import streamlit as st
 import sys
 import os
-import pandas as pd
-from datetime import datetime
+from datetime import datetime, timedelta
 
-# Add the src directory to the Python path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+# Add the src directory to the Python path once, even across reruns and reloads
+_SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if _SRC_DIR not in sys.path:
+    sys.path.append(_SRC_DIR)
 
 # Import only what we need to avoid wildcard imports
 from core.data_extractors.hc_collect import (
     get_method_raw_data, 
     get_method_last_update, 
-    get_all_methods_status,
+    get_all_methods_status_df,
     collect_method_data,
     collect_all_methods_data,
     initialize_token_manager,
@@ -429,6 +430,9 @@ def main():
     </style>
     """, unsafe_allow_html=True)
     
+    # Initialize page in session state if not exists
+    st.session_state.setdefault("page", "Home")
+
     # Sidebar navigation
     with st.sidebar:
         # Header
@@ -438,11 +442,7 @@ def main():
             <p>Personal Health Dashboard</p>
         </div>
         """, unsafe_allow_html=True)
-    
-    # Initialize page in session state if not exists
-    if 'page' not in st.session_state:
-        st.session_state.page = "Home"
-    
+
         # Navigation items
         nav_items = [
             ("Home", "🏠", "Home"),
@@ -609,23 +609,19 @@ def show_life_page():
 def show_hcg_summary():
     """Display Health Connect Gateway summary on home page."""
     try:
-        status_data = get_all_methods_status()
+        status_df = get_all_methods_status_df()
         
         # Calculate summary stats
         total_methods = len(METHODS)
-        methods_with_data = sum(1 for status in status_data.values() if status['has_data'])
-        total_records = sum(status.get('record_count', 0) for status in status_data.values())
+        methods_with_data = int(status_df['has_data'].sum())
+        total_records = int(status_df['record_count'].sum())
         
-        # Get most recent update
-        recent_updates = []
-        for method, status in status_data.items():
-            last_update = status.get('last_update', 'Never')
-            if last_update != 'Never' and not last_update.startswith('Invalid'):
-                recent_updates.append((method, last_update))
-        
-        # Sort by timestamp string (works because of YYYY-MM-DD format)
-        recent_updates.sort(key=lambda x: x[1], reverse=True)
-        last_update_text = recent_updates[0][1] if recent_updates else "Never"
+        # Get most recent update (max works because of YYYY-MM-DD format)
+        valid_updates = status_df['last_update'].where(
+            (status_df['last_update'] != 'Never') & ~status_df['last_update'].str.startswith('Invalid')
+        ).dropna()
+        has_recent_updates = not valid_updates.empty
+        last_update_text = valid_updates.max() if has_recent_updates else "Never"
         
         col1, col2 = st.columns(2)
         
@@ -639,18 +635,14 @@ def show_hcg_summary():
             st.subheader("🕒 Recent Activity")
             st.info(f"Last Update: {last_update_text}")
             
-            if recent_updates:
+            if has_recent_updates:
                 st.success("✅ Data collection active")
                 
                 # Show top methods by record count
-                top_methods = sorted(
-                    [(method, status.get('record_count', 0)) for method, status in status_data.items()],
-                    key=lambda x: x[1],
-                    reverse=True
-                )[:3]
+                top_methods = status_df.nlargest(3, 'record_count')
                 
                 st.write("**Top Methods by Records:**")
-                for method, count in top_methods:
+                for method, count in top_methods[['method', 'record_count']].itertuples(index=False):
                     if count > 0:
                         st.write(f"• {method}: {count:,} records")
             else:
@@ -714,7 +706,7 @@ def show_data_sources_page():
         with col2:
             start_date_input = st.date_input(
                 "Start Date",
-                value=datetime.now().date() - pd.Timedelta(days=7),
+                value=datetime.now().date() - timedelta(days=7),
                 help="Start date for data collection"
             )
             start_date = f"{start_date_input}T00:00:00Z"
@@ -756,7 +748,7 @@ def show_data_sources_page():
     
     # Get status for all methods
     try:
-        status_data = get_all_methods_status()
+        status_df = get_all_methods_status_df()
         
         # Display methods in tabs
         if METHODS:
@@ -764,7 +756,7 @@ def show_data_sources_page():
             tab1, tab2 = st.tabs(["📊 Method Status", "📋 Raw Data Viewer"])
             
             with tab1:
-                show_methods_status(status_data, start_date, end_date)
+                show_methods_status(status_df, start_date, end_date)
             
             with tab2:
                 show_raw_data_viewer()
@@ -774,13 +766,13 @@ def show_data_sources_page():
     except Exception as e:
         st.error(f"Error loading data: {e}")
 
-def show_methods_status(status_data, start_date=None, end_date=None):
+def show_methods_status(status_df, start_date=None, end_date=None):
     """Display status information for all methods."""
     st.subheader("Methods Status Overview")
     
     # Create metrics row
     total_methods = len(METHODS)
-    methods_with_data = sum(1 for status in status_data.values() if status['has_data'])
+    methods_with_data = int(status_df['has_data'].sum())
     
     col1, col2, col3 = st.columns(3)
     with col1:
@@ -793,18 +785,18 @@ def show_methods_status(status_data, start_date=None, end_date=None):
     st.markdown("---")
     
     # Display each method
-    for method in METHODS:
-        status = status_data.get(method, {})
+    for status in status_df.itertuples(index=False):
+        method = status.method
         
         with st.expander(f"📊 {method}", expanded=False):
             col1, col2, col3 = st.columns([2, 2, 1])
             
             with col1:
-                st.write(f"**Last Update:** {status.get('last_update', 'Never')}")
-                st.write(f"**Records:** {status.get('record_count', 0):,}")
+                st.write(f"**Last Update:** {status.last_update}")
+                st.write(f"**Records:** {status.record_count:,}")
             
             with col2:
-                if status.get('has_data', False):
+                if status.has_data:
                     st.success("✅ Has data")
                 else:
                     st.warning("⚠️ No data")
@@ -815,16 +807,23 @@ def show_methods_status(status_data, start_date=None, end_date=None):
 
 def show_raw_data_viewer():
     """Display raw data viewer for methods."""
+    import pandas as pd
+
     st.subheader("Raw Data Viewer")
     
-    # Method selector
-    selected_method = st.selectbox(
-        "Select method to view raw data:",
-        METHODS,
-        key="raw_data_method"
-    )
-    
-    if selected_method:
+    # Method selector (inside a form so browsing the list doesn't reload data)
+    with st.form("raw_data_form"):
+        selected_method = st.selectbox(
+            "Select method to view raw data:",
+            METHODS,
+            key="raw_data_method"
+        )
+        submitted = st.form_submit_button("📋 Load")
+
+    if submitted:
+        st.session_state.raw_data_loaded = True
+
+    if selected_method and st.session_state.get("raw_data_loaded", False):
         # Get raw data
         try:
             df = get_method_raw_data(selected_method, limit=5)
@@ -871,6 +870,9 @@ def update_single_method(method, start_date=None, end_date=None):
                     if 'token_manager' in st.session_state:
                         del st.session_state.token_manager
             else:
+                # New records invalidate the cached health data; cached figures stay valid
+                from components.health_dashboard import _cached_health_data
+                _cached_health_data.clear()
                 st.success(f"✅ Updated {method}: {count} new records{date_info}")
                 if since:
                     st.info(f"📅 Reference date: {since}")
@@ -910,6 +912,9 @@ def update_all_methods(start_date=None, end_date=None):
                     success_count += 1
             
             if success_count > 0:
+                # New records invalidate the cached health data; cached figures stay valid
+                from components.health_dashboard import _cached_health_data
+                _cached_health_data.clear()
                 st.success(f"✅ Updated {success_count} methods successfully. Total new records: {total_records}{date_info}")
             
             if error_count > 0:
@@ -981,7 +986,7 @@ def show_data_sources_management():
         with col2:
             start_date_input = st.date_input(
                 "Start Date",
-                value=datetime.now().date() - pd.Timedelta(days=7),
+                value=datetime.now().date() - timedelta(days=7),
                 help="Start date for data collection"
             )
             start_date = f"{start_date_input}T00:00:00Z"
@@ -1016,23 +1021,23 @@ def show_data_sources_management():
     
     # Get status for all methods
     try:
-        status_data = get_all_methods_status()
+        status_df = get_all_methods_status_df()
         
         # Display methods status
         if METHODS:
             st.markdown("### 📊 Data Sources Status")
-            show_methods_status_compact(status_data, start_date, end_date)
+            show_methods_status_compact(status_df, start_date, end_date)
         else:
             st.warning("No methods configured.")
             
     except Exception as e:
         st.error(f"Error loading data: {e}")
 
-def show_methods_status_compact(status_data, start_date=None, end_date=None):
+def show_methods_status_compact(status_df, start_date=None, end_date=None):
     """Display compact status information for all methods in settings."""
     # Create metrics row
     total_methods = len(METHODS)
-    methods_with_data = sum(1 for status in status_data.values() if status['has_data'])
+    methods_with_data = int(status_df['has_data'].sum())
     
     col1, col2, col3 = st.columns(3)
     with col1:
@@ -1043,13 +1048,13 @@ def show_methods_status_compact(status_data, start_date=None, end_date=None):
         st.metric("Empty", total_methods - methods_with_data)
     
     # Display each method in a compact format
-    for method in METHODS:
-        status = status_data.get(method, {})
+    for status in status_df.itertuples(index=False):
+        method = status.method
         
         col1, col2, col3, col4 = st.columns([3, 2, 2, 1])
         
         with col1:
-            status_color = "green" if status.get('has_data', False) else "yellow"
+            status_color = "green" if status.has_data else "yellow"
             st.markdown(f"""
             <div style="display: flex; align-items: center;">
                 <span class="status-dot {status_color}"></span>
@@ -1058,10 +1063,10 @@ def show_methods_status_compact(status_data, start_date=None, end_date=None):
             """, unsafe_allow_html=True)
         
         with col2:
-            st.write(f"{status.get('record_count', 0):,} records")
+            st.write(f"{status.record_count:,} records")
         
         with col3:
-            st.write(f"{status.get('last_update', 'Never')}")
+            st.write(f"{status.last_update}")
         
         with col4:
             if st.button("🔄", key=f"update_{method}_compact"):
@@ -5,60 +5,309 @@ Advanced visualizations for health data including 3D body visualization.
 
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.subplots import make_subplots
-import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-from typing import Dict, Any, List
+from datetime import datetime
+from string import Template
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Tuple
+import io
+import re
 import sys
 import os
 import time
+import traceback
+from contextlib import redirect_stdout
 
-# Add the src directory to the Python path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+# Add the src directory to the Python path once, even across reruns and reloads
+_SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if _SRC_DIR not in sys.path:
+    sys.path.append(_SRC_DIR)
 
 from core.analytics.health_analytics import get_comprehensive_health_data
 from core.data_extractors.hc_collect import push_height_data, push_weight_data, initialize_token_manager
 
+@st.cache_data(ttl=300, max_entries=8, show_spinner=False)
+def _cached_health_data() -> Dict[str, Any]:
+    """Load comprehensive health data, reused across reruns for up to 5 minutes."""
+    return get_comprehensive_health_data()
+
+# Fallback health record shown when loading fails. Read-only: do not mutate.
+_EMPTY_HEALTH_DATA = {
+    'body_composition': {},
+    'vital_signs': {},
+    'fitness': {},
+    'health_score': {'overall': 0}
+}
+
+# Minimum interval between two gateway pushes of the same metric
+_PUSH_DEBOUNCE_SECONDS = 1.0
+
+# Plotly client config for every dashboard chart: static toolbar-free views
+_PLOTLY_CONFIG = {'displayModeBar': False, 'scrollZoom': False, 'responsive': True}
+
+# BMI category bands shared by the BMI charts
+_BMI_CATEGORIES = ('Underweight', 'Normal', 'Overweight', 'Obese')
+_BMI_RANGES = (18.5, 25, 30, 40)
+_BMI_RANGE_TEXT = tuple(f'{r}' for r in _BMI_RANGES)
+_BMI_BOUNDS = np.array([18.5, 25, 30])
+
+# BMI status bands for the metrics charts: <18.5, 18.5-25, 25-30 and >30, upper bounds inclusive
+_BMI_STATUS_BOUNDS = np.array([np.nextafter(18.5, -np.inf), 25, 30])
+
+# Key metrics bar chart: label, divisor and theme color per metric (BMI is colored by band)
+_KEY_METRIC_LABELS = ('Weight', 'BMI', 'BMR/100', 'Distance (km)')
+_KEY_METRIC_DIVISORS = np.array([1, 1, 100, 1])  # Scale BMR down for better visualization
+_KEY_METRIC_COLORS = ('primary', None, 'secondary', 'accent')
+
+# Sample dates for the trend chart demo series (in real app, use actual time series data)
+_TREND_DATES = np.arange(np.datetime64('2025-08-01'), np.datetime64('2025-09-03'), dtype='datetime64[D]')
+
+# Noise standard deviation for the weight, heart rate and BMR demo series
+_TREND_SIGMAS = np.array([0.5, 3, 20], dtype=np.float32)
+
+@st.cache_data(show_spinner=False)
+def _synth_trend_series(bases: Tuple[float, float, float, float], n: int) -> np.ndarray:
+    """
+    Generate reproducible demo series for the trend chart in one batched draw.
+    
+    Args:
+        bases: Base values for weight, heart rate, BMR and steps
+        n: Number of points per series
+    
+    Returns:
+        float32 array of shape (4, n); identical inputs always produce the same array
+    """
+    rng = np.random.default_rng(seed=hash((bases, n)) & 0xFFFFFFFF)
+    series = np.empty((4, n), dtype=np.float32)
+    noise = rng.standard_normal((3, n), dtype=np.float32)
+    series[:3] = np.asarray(bases[:3], dtype=np.float32)[:, None] + noise * _TREND_SIGMAS[:, None]
+    series[3] = rng.poisson(bases[3], n)
+    return series
+
+# Minimal color theme, built once and shared read-only by every chart
+_MINIMAL_THEME = MappingProxyType({
+    'bg_color': '#ffffff',
+    'primary': '#2c3e50',
+    'secondary': '#3498db',
+    'accent': '#e74c3c',
+    'success': '#27ae60',
+    'warning': '#f39c12',
+    'danger': '#e74c3c',
+    'text': '#2c3e50',
+    'grid': '#ecf0f1',
+    'light_gray': '#f8f9fa',
+    'medium_gray': '#95a5a6',
+    'border': '#bdc3c7'
+})
+
+def _bmi_bar_color_table(palette: Tuple[str, ...], background: str) -> Tuple[Tuple[str, ...], ...]:
+    """
+    Precompute BMI bar colors for every current category.
+    
+    Args:
+        palette: Color of each BMI category bar when it is the current one
+        background: Color of the other bars
+    
+    Returns:
+        Tuple indexed by current category, each holding one color per bar
+    """
+    return tuple(
+        tuple(color if i == current else background for i, color in enumerate(palette))
+        for current in range(len(palette))
+    )
+
+_MINIMAL_BMI_BAR_COLORS = _bmi_bar_color_table(
+    (_MINIMAL_THEME['secondary'], _MINIMAL_THEME['success'], _MINIMAL_THEME['warning'], _MINIMAL_THEME['danger']),
+    _MINIMAL_THEME['light_gray']
+)
+
+def _minimal_score_color(overall_score: float) -> str:
+    """
+    Pick the minimal theme color of the health score ring.
+    
+    Args:
+        overall_score: Overall health score (0-100)
+    
+    Returns:
+        Success color from 80, warning from 60, danger below
+    """
+    if overall_score >= 80:
+        return _MINIMAL_THEME['success']
+    if overall_score >= 60:
+        return _MINIMAL_THEME['warning']
+    return _MINIMAL_THEME['danger']
+
 def create_minimal_theme():
     """Create a minimal futuristic color theme for visualizations."""
-    return {
-        'bg_color': '#ffffff',
-        'primary': '#2c3e50',
-        'secondary': '#3498db',
-        'accent': '#e74c3c',
-        'success': '#27ae60',
-        'warning': '#f39c12',
-        'danger': '#e74c3c',
-        'text': '#2c3e50',
-        'grid': '#ecf0f1',
-        'light_gray': '#f8f9fa',
-        'medium_gray': '#95a5a6',
-        'border': '#bdc3c7'
-    }
+    return _MINIMAL_THEME
+
+# Hospital color theme, built once and shared read-only by every hospital chart
+_HOSPITAL_THEME = MappingProxyType({
+    # Use CSS custom properties for consistent theming
+    'bg_color': 'var(--bg-primary)',
+    'primary': 'var(--primary-blue)',
+    'secondary': 'var(--primary-blue-dark)',
+    'accent': 'var(--success-green)',
+    'success': 'var(--success-green)',
+    'warning': 'var(--warning-amber)',
+    'danger': 'var(--danger-red)',
+    'text': 'var(--text-primary)',
+    'text_light': 'var(--text-secondary)',
+    'grid': 'var(--border-primary)',
+    'light_gray': 'var(--bg-tertiary)',
+    'medium_gray': 'var(--text-tertiary)',
+    'border': 'var(--border-secondary)',
+    'card_bg': 'var(--surface-elevated)',
+    'shadow': 'var(--shadow-sm)'
+})
+
+# Chart font shared by every hospital chart, set once per layout: plotly.js
+# inherits it for tick labels, bar text, annotations and the gauge number
+_HOSPITAL_FONT_FAMILY = '-apple-system, BlinkMacSystemFont, sans-serif'
+_HOSPITAL_TEXT_FONT = {'color': _HOSPITAL_THEME['text'], 'family': _HOSPITAL_FONT_FAMILY}
+
+_HOSPITAL_BMI_BAR_COLORS = _bmi_bar_color_table(
+    (_HOSPITAL_THEME['warning'], _HOSPITAL_THEME['success'], _HOSPITAL_THEME['warning'], _HOSPITAL_THEME['danger']),
+    _HOSPITAL_THEME['light_gray']
+)
+
+# Track drawn behind the hospital health score gauge; the score bands all share
+# one fill, so a single step draws the same arc
+_HOSPITAL_GAUGE_STEPS = (
+    {'range': [0, 100], 'color': _HOSPITAL_THEME['light_gray']},
+)
+
+# Gauge bar color per _SCORE_BOUNDS band: <40, 40-60, 60-80 and 80+
+_HOSPITAL_GAUGE_COLORS = (
+    _HOSPITAL_THEME['danger'], _HOSPITAL_THEME['warning'], _HOSPITAL_THEME['primary'], _HOSPITAL_THEME['success']
+)
 
 def create_hospital_theme():
     """Create a hospital-style color theme for medical visualizations with CSS custom properties."""
+    return _HOSPITAL_THEME
+
+@st.cache_resource
+def _make_trend_layout() -> Dict[str, Any]:
+    """Shared layout template for the trend chart. Read-only: do not mutate."""
+    theme = create_minimal_theme()
+    # Same formatting for the x and y axes of all four subplots
+    axis = {'gridcolor': theme['grid'], 'tickcolor': theme['text'], 'tickfont': {'color': theme['text']}}
+    axes = {f'{a}axis{i if i > 1 else ""}': axis for a in 'xy' for i in range(1, 5)}
+    return {
+        **axes,
+        'title': {
+            'text': '📈 TEMPORAL BIOMETRIC ANALYSIS',
+            'x': 0.5,
+            'font': {'size': 18, 'color': theme['primary'], 'family': 'Courier New'}
+        },
+        'paper_bgcolor': theme['bg_color'],
+        'plot_bgcolor': theme['bg_color'],
+        'font': {'color': theme['text'], 'family': 'Courier New'},
+        'showlegend': False,
+        'height': 500
+    }
+
+@st.cache_resource
+def _make_hospital_bmi_layout() -> Dict[str, Any]:
+    """Shared layout template for the hospital BMI chart. Read-only: do not mutate."""
+    theme = create_hospital_theme()
+    return {
+        'paper_bgcolor': theme['bg_color'],
+        'plot_bgcolor': theme['bg_color'],
+        'font': _HOSPITAL_TEXT_FONT,
+        'showlegend': False,
+        'height': 250,
+        'margin': {'l': 80, 'r': 20, 't': 20, 'b': 40},
+        'xaxis': {'gridcolor': theme['grid'], 'tickcolor': theme['text'], 'range': [15, 35]},
+        'yaxis': {'tickcolor': theme['text']}
+    }
+
+@st.cache_resource
+def _make_hospital_metrics_layout() -> Dict[str, Any]:
+    """Shared layout template for the hospital metrics chart. Read-only: do not mutate."""
+    theme = create_hospital_theme()
+    return {
+        'paper_bgcolor': theme['bg_color'],
+        'plot_bgcolor': theme['bg_color'],
+        'font': _HOSPITAL_TEXT_FONT,
+        'showlegend': False,
+        'height': 250,
+        'margin': {'l': 40, 'r': 40, 't': 20, 'b': 40},
+        'xaxis': {'tickcolor': theme['text'], 'tickfont': {'size': 11}},
+        'yaxis': {'gridcolor': theme['grid'], 'tickcolor': theme['text']}
+    }
+
+@st.cache_resource
+def _make_hospital_gauge_layout() -> Dict[str, Any]:
+    """Shared layout template for the hospital health score gauge. Read-only: do not mutate."""
+    theme = create_hospital_theme()
     return {
-        # Use CSS custom properties for consistent theming
-        'bg_color': 'var(--bg-primary)',
-        'primary': 'var(--primary-blue)',
-        'secondary': 'var(--primary-blue-dark)',
-        'accent': 'var(--success-green)',
-        'success': 'var(--success-green)',
-        'warning': 'var(--warning-amber)',
-        'danger': 'var(--danger-red)',
-        'text': 'var(--text-primary)',
-        'text_light': 'var(--text-secondary)',
-        'grid': 'var(--border-primary)',
-        'light_gray': 'var(--bg-tertiary)',
-        'medium_gray': 'var(--text-tertiary)',
-        'border': 'var(--border-secondary)',
-        'card_bg': 'var(--surface-elevated)',
-        'shadow': 'var(--shadow-sm)'
+        'paper_bgcolor': theme['bg_color'],
+        'plot_bgcolor': theme['bg_color'],
+        'font': _HOSPITAL_TEXT_FONT,
+        'height': 300,
+        'margin': {'l': 20, 'r': 20, 't': 20, 'b': 20}
     }
 
+@st.cache_resource
+def _make_empty_figure() -> go.Figure:
+    """Shared placeholder figure for charts with no health data. Read-only: do not mutate."""
+    theme = create_minimal_theme()
+    fig = go.Figure()
+    fig.update_layout(
+        title="No health data available",
+        paper_bgcolor=theme['bg_color'],
+        plot_bgcolor=theme['bg_color'],
+        height=300
+    )
+    return fig
+
+@st.cache_resource
+def _make_empty_hospital_figure() -> go.Figure:
+    """Shared placeholder figure for hospital charts with no data. Read-only: do not mutate."""
+    theme = create_hospital_theme()
+    return go.Figure(layout={
+        'paper_bgcolor': theme['bg_color'],
+        'plot_bgcolor': theme['bg_color'],
+        'font': _HOSPITAL_TEXT_FONT,
+        'height': 250
+    })
+
+def _has_health_data(health_data: Dict[str, Any]) -> bool:
+    """Check whether any chartable health data section is populated."""
+    return any(health_data.get(key) for key in ('body_composition', 'vital_signs', 'fitness'))
+
+def _metric_value(section: Dict[str, Any], metric: str, field: str = 'current', default: Any = None) -> Any:
+    """
+    Read one field of a metric from a health data section.
+    
+    Args:
+        section: Health data section, e.g. health_data['body_composition']
+        metric: Metric name within the section
+        field: Field of the metric to read
+        default: Value returned when the metric or field is missing
+    
+    Returns:
+        The field value, or default
+    """
+    values = section.get(metric)
+    return values.get(field, default) if values else default
+
+@lru_cache(maxsize=32)
+def _format_generated_at(generated_at: str) -> str:
+    """
+    Format the health data generation timestamp for display.
+    
+    Args:
+        generated_at: ISO-8601 timestamp from health_data['generated_at']
+    
+    Returns:
+        Timestamp formatted like 'September 02, 2025 at 14:30 UTC'
+    """
+    return datetime.fromisoformat(generated_at).strftime('%B %d, %Y at %H:%M UTC')
+
 def create_body_composition_chart(health_data: Dict[str, Any]) -> go.Figure:
     """
     Create a clean, minimal body composition visualization.
@@ -69,32 +318,36 @@ def create_body_composition_chart(health_data: Dict[str, Any]) -> go.Figure:
     Returns:
         Plotly figure with body composition metrics
     """
-    theme = create_minimal_theme()
+    if not _has_health_data(health_data):
+        return _make_empty_figure()
+    
     body_comp = health_data.get('body_composition', {})
+    return _body_composition_figure(_metric_value(body_comp, 'bmi', 'current', 0))
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _body_composition_figure(bmi: float) -> go.Figure:
+    """
+    Build the BMI analysis figure, cached per BMI value.
+    
+    Args:
+        bmi: Current BMI, 0 if unknown
+    
+    Returns:
+        Plotly figure with body composition metrics
+    """
+    theme = create_minimal_theme()
     
     # Create a clean donut chart for BMI visualization
     fig = go.Figure()
     
-    # BMI visualization
-    bmi = body_comp.get('bmi', {}).get('current', 0)
-    weight = body_comp.get('weight', {}).get('current', 0)
-    height = body_comp.get('height', {}).get('current', 0)
-    bmr = body_comp.get('basalMetabolicRate', {}).get('current', 0)
-    
     if bmi > 0:
         # BMI categories visualization
-        categories = ['Underweight', 'Normal', 'Overweight', 'Obese']
-        ranges = [18.5, 25, 30, 40]
-        colors = [theme['secondary'], theme['success'], theme['warning'], theme['danger']]
+        categories = _BMI_CATEGORIES
+        ranges = _BMI_RANGES
         
-        # Determine current category
-        current_category = 0
-        if bmi >= 30:
-            current_category = 3
-        elif bmi >= 25:
-            current_category = 2
-        elif bmi >= 18.5:
-            current_category = 1
+        # Determine current category and highlight only its bar
+        current_category = int(np.searchsorted(_BMI_BOUNDS, bmi, side='right'))
+        bar_colors = _MINIMAL_BMI_BAR_COLORS[current_category]
         
         # Create horizontal bar chart for BMI ranges
         fig.add_trace(go.Bar(
@@ -102,10 +355,10 @@ def create_body_composition_chart(health_data: Dict[str, Any]) -> go.Figure:
             x=ranges,
             orientation='h',
             marker={
-                'color': [colors[i] if i == current_category else theme['light_gray'] for i in range(len(categories))],
+                'color': bar_colors,
                 'line': {'color': theme['border'], 'width': 1}
             },
-            text=[f'{r}' for r in ranges],
+            text=_BMI_RANGE_TEXT,
             textposition='inside',
             name='BMI Ranges'
         ))
@@ -141,25 +394,50 @@ def create_body_composition_chart(health_data: Dict[str, Any]) -> go.Figure:
         font={'color': theme['text'], 'family': 'Arial'},
         showlegend=False,
         height=300,
-        margin={'l': 80, 'r': 20, 't': 60, 'b': 40}
+        margin={'l': 80, 'r': 20, 't': 60, 'b': 40},
+        xaxis={
+            'title': {'text': 'BMI Value', 'font': {'color': theme['text']}},
+            'gridcolor': theme['grid'],
+            'tickcolor': theme['text'],
+            'tickfont': {'color': theme['text']},
+            'range': [15, 35]
+        },
+        yaxis={
+            'tickcolor': theme['text'],
+            'title': {'font': {'color': theme['text']}},
+            'tickfont': {'color': theme['text']}
+        }
     )
     
-    fig.update_xaxes(
-        title='BMI Value',
-        gridcolor=theme['grid'],
-        tickcolor=theme['text'],
-        title_font={'color': theme['text']},
-        tickfont={'color': theme['text']},
-        range=[15, 35]
-    )
+    return fig
+
+def _key_metric_bars(weight: Optional[float], bmi: Optional[float], bmr: Optional[float],
+                     distance: Optional[float], theme) -> Tuple[List[str], np.ndarray, List[str]]:
+    """
+    Select the key metrics that have data along with their bar values and colors.
     
-    fig.update_yaxes(
-        tickcolor=theme['text'],
-        title_font={'color': theme['text']},
-        tickfont={'color': theme['text']}
-    )
+    Args:
+        weight: Current weight in kg
+        bmi: Current BMI
+        bmr: Current basal metabolic rate in kcal/day
+        distance: Average daily distance in km
+        theme: Color theme to draw from
     
-    return fig
+    Returns:
+        Tuple of (labels, values, colors) for the metrics present, in chart order
+    """
+    raw = (weight, bmi, bmr, distance)
+    present = np.array([bool(v) for v in raw])
+    values = np.array([v or 0 for v in raw], dtype=float) / _KEY_METRIC_DIVISORS
+    
+    colors = [theme[key] if key else None for key in _KEY_METRIC_COLORS]
+    if bmi:
+        # Color based on BMI category
+        bmi_colors = (theme['danger'], theme['success'], theme['warning'], theme['danger'])
+        colors[1] = bmi_colors[int(np.searchsorted(_BMI_STATUS_BOUNDS, bmi))]
+    
+    keep = np.flatnonzero(present)
+    return [_KEY_METRIC_LABELS[i] for i in keep], values[present], [colors[i] for i in keep]
 
 def create_key_metrics_chart(health_data: Dict[str, Any]) -> go.Figure:
     """
@@ -171,58 +449,41 @@ def create_key_metrics_chart(health_data: Dict[str, Any]) -> go.Figure:
     Returns:
         Plotly metrics chart figure
     """
-    theme = create_minimal_theme()
     body_comp = health_data.get('body_composition', {})
     fitness = health_data.get('fitness', {})
+    if not (body_comp or fitness):
+        return _make_empty_figure()
+    
+    return _key_metrics_figure(
+        _metric_value(body_comp, 'weight'),
+        _metric_value(body_comp, 'bmi'),
+        _metric_value(body_comp, 'basalMetabolicRate'),
+        _metric_value(fitness, 'distance', 'daily_avg')
+    )
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _key_metrics_figure(weight: Optional[float], bmi: Optional[float],
+                        bmr: Optional[float], distance: Optional[float]) -> go.Figure:
+    """
+    Build the key metrics bar chart, cached per metric values.
+    
+    Args:
+        weight: Current weight in kg
+        bmi: Current BMI
+        bmr: Current basal metabolic rate in kcal/day
+        distance: Average daily distance in km
+    
+    Returns:
+        Plotly metrics chart figure
+    """
+    theme = create_minimal_theme()
     
     # Prepare data for metrics
-    metrics = []
-    values = []
-    colors = []
-    
-    # Weight
-    weight = body_comp.get('weight', {}).get('current')
-    if weight:
-        metrics.append('Weight')
-        values.append(weight)
-        colors.append(theme['primary'])
-    
-    # BMI
-    bmi = body_comp.get('bmi', {}).get('current')
-    if bmi:
-        metrics.append('BMI')
-        values.append(bmi)
-        # Color based on BMI category
-        if 18.5 <= bmi <= 25:
-            colors.append(theme['success'])
-        elif 25 < bmi <= 30:
-            colors.append(theme['warning'])
-        else:
-            colors.append(theme['danger'])
-    
-    # BMR (scaled down for visualization)
-    bmr = body_comp.get('basalMetabolicRate', {}).get('current')
-    if bmr:
-        metrics.append('BMR/100')
-        values.append(bmr / 100)  # Scale down for better visualization
-        colors.append(theme['secondary'])
-    
-    # Distance
-    distance = fitness.get('distance', {}).get('daily_avg')
-    if distance:
-        metrics.append('Distance (km)')
-        values.append(distance)
-        colors.append(theme['accent'])
+    metrics, values, colors = _key_metric_bars(weight, bmi, bmr, distance, theme)
     
     if not metrics:
         # Return empty figure if no data
-        fig = go.Figure()
-        fig.update_layout(
-            title="No health data available",
-            paper_bgcolor=theme['bg_color'],
-            plot_bgcolor=theme['bg_color']
-        )
-        return fig
+        return _make_empty_figure()
     
     # Create bar chart
     fig = go.Figure(data=[
@@ -233,7 +494,7 @@ def create_key_metrics_chart(health_data: Dict[str, Any]) -> go.Figure:
                 'color': colors,
                 'line': {'color': theme['border'], 'width': 1}
             },
-            text=[f'{v:.1f}' for v in values],
+            texttemplate='%{y:.1f}',
             textposition='outside',
             textfont={'color': theme['text'], 'size': 12}
         )
@@ -250,20 +511,18 @@ def create_key_metrics_chart(health_data: Dict[str, Any]) -> go.Figure:
         font={'color': theme['text'], 'family': 'Arial'},
         showlegend=False,
         height=300,
-        margin={'l': 40, 'r': 40, 't': 60, 'b': 40}
-    )
-    
-    fig.update_xaxes(
-        tickcolor=theme['text'],
-        title_font={'color': theme['text']},
-        tickfont={'color': theme['text'], 'size': 11}
-    )
-    
-    fig.update_yaxes(
-        gridcolor=theme['grid'],
-        tickcolor=theme['text'],
-        title_font={'color': theme['text']},
-        tickfont={'color': theme['text']}
+        margin={'l': 40, 'r': 40, 't': 60, 'b': 40},
+        xaxis={
+            'tickcolor': theme['text'],
+            'title': {'font': {'color': theme['text']}},
+            'tickfont': {'color': theme['text'], 'size': 11}
+        },
+        yaxis={
+            'gridcolor': theme['grid'],
+            'tickcolor': theme['text'],
+            'title': {'font': {'color': theme['text']}},
+            'tickfont': {'color': theme['text']}
+        }
     )
     
     return fig
@@ -278,28 +537,58 @@ def create_health_trend_chart(health_data: Dict[str, Any]) -> go.Figure:
     Returns:
         Plotly time series figure
     """
-    theme = create_futuristic_theme()
+    if not _has_health_data(health_data):
+        return _make_empty_figure()
+    
+    body_comp = health_data.get('body_composition', {})
+    vital_signs = health_data.get('vital_signs', {})
+    fitness = health_data.get('fitness', {})
+    return _health_trend_figure(
+        _metric_value(body_comp, 'weight'),
+        _metric_value(vital_signs, 'heartRate', 'resting'),
+        _metric_value(body_comp, 'basalMetabolicRate'),
+        _metric_value(fitness, 'steps', 'daily_avg')
+    )
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _health_trend_figure(base_weight: Optional[float], base_hr: Optional[float],
+                         base_bmr: Optional[float], base_steps: Optional[float]) -> go.Figure:
+    """
+    Build the trend chart around the given base values, cached per base values.
+    
+    Args:
+        base_weight: Current weight in kg
+        base_hr: Resting heart rate in bpm
+        base_bmr: Current basal metabolic rate in kcal/day
+        base_steps: Average daily steps
+    
+    Returns:
+        Plotly time series figure
+    """
+    theme = create_minimal_theme()
     
+    # Styled layout is set at construction; make_subplots only adds the grid
     fig = make_subplots(
         rows=2, cols=2,
         subplot_titles=('Weight Trend', 'Heart Rate', 'BMR', 'Activity'),
         specs=[[{"secondary_y": False}, {"secondary_y": False}],
                [{"secondary_y": False}, {"secondary_y": False}]],
         vertical_spacing=0.1,
-        horizontal_spacing=0.1
+        horizontal_spacing=0.1,
+        figure=go.Figure(layout=_make_trend_layout())
     )
     
-    # Sample data for demonstration (in real app, use actual time series data)
-    dates = pd.date_range(start='2025-08-01', end='2025-09-02', freq='D')
+    dates = _TREND_DATES
+    
+    # One batched draw for all four demo series
+    weight_data, hr_data, bmr_data, steps_data = _synth_trend_series(
+        (base_weight or 0, base_hr or 0, base_bmr or 0, base_steps or 0), len(dates)
+    )
     
     # Weight trend
-    body_comp = health_data.get('body_composition', {})
-    if body_comp.get('weight', {}).get('current'):
-        base_weight = body_comp['weight']['current']
-        weight_data = base_weight + np.random.normal(0, 0.5, len(dates))
-        
+    if base_weight:
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=dates, y=weight_data,
                 mode='lines+markers',
                 line={'color': theme['primary'], 'width': 2},
@@ -310,13 +599,9 @@ def create_health_trend_chart(health_data: Dict[str, Any]) -> go.Figure:
         )
     
     # Heart rate data
-    vital_signs = health_data.get('vital_signs', {})
-    if vital_signs.get('heartRate', {}).get('resting'):
-        base_hr = vital_signs['heartRate']['resting']
-        hr_data = base_hr + np.random.normal(0, 3, len(dates))
-        
+    if base_hr:
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=dates, y=hr_data,
                 mode='lines+markers',
                 line={'color': theme['danger'], 'width': 2},
@@ -327,12 +612,9 @@ def create_health_trend_chart(health_data: Dict[str, Any]) -> go.Figure:
         )
     
     # BMR data
-    if body_comp.get('basalMetabolicRate', {}).get('current'):
-        base_bmr = body_comp['basalMetabolicRate']['current']
-        bmr_data = base_bmr + np.random.normal(0, 20, len(dates))
-        
+    if base_bmr:
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=dates, y=bmr_data,
                 mode='lines+markers',
                 line={'color': theme['warning'], 'width': 2},
@@ -343,13 +625,9 @@ def create_health_trend_chart(health_data: Dict[str, Any]) -> go.Figure:
         )
     
     # Activity data (steps)
-    fitness = health_data.get('fitness', {})
-    if fitness.get('steps', {}).get('daily_avg'):
-        base_steps = fitness['steps']['daily_avg']
-        steps_data = np.random.poisson(base_steps, len(dates))
-        
+    if base_steps:
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=dates, y=steps_data,
                 mode='lines+markers',
                 line={'color': theme['success'], 'width': 2},
@@ -359,89 +637,106 @@ def create_health_trend_chart(health_data: Dict[str, Any]) -> go.Figure:
             row=2, col=2
         )
     
-    fig.update_layout(
-        title={
-            'text': '📈 TEMPORAL BIOMETRIC ANALYSIS',
-            'x': 0.5,
-            'font': {'size': 18, 'color': theme['primary'], 'family': 'Courier New'}
-        },
-        paper_bgcolor=theme['bg_color'],
-        plot_bgcolor=theme['bg_color'],
-        font={'color': theme['text'], 'family': 'Courier New'},
-        showlegend=False,
-        height=500
-    )
-    
-    # Update all axes with proper formatting
-    fig.update_xaxes(
-        gridcolor=theme['grid'], 
-        tickcolor=theme['text'],
-        tickfont={'color': theme['text']}
-    )
-    fig.update_yaxes(
-        gridcolor=theme['grid'], 
-        tickcolor=theme['text'],
-        tickfont={'color': theme['text']}
-    )
-    
     return fig
 
-def create_health_score_gauge(health_data: Dict[str, Any]) -> go.Figure:
+def _health_score_ring_html(overall_score: int) -> str:
     """
-    Create a clean, minimal health score gauge.
+    Build a lightweight SVG progress ring for the health score.
     
     Args:
-        health_data: Health data dictionary
+        overall_score: Overall health score (0-100)
     
     Returns:
-        Plotly gauge figure
+        HTML snippet to render with st.markdown
     """
     theme = create_minimal_theme()
-    health_score = health_data.get('health_score', {})
-    overall_score = health_score.get('overall', 0)
     
-    # Determine color based on score
-    if overall_score >= 80:
-        bar_color = theme['success']
-    elif overall_score >= 60:
-        bar_color = theme['warning']
-    else:
-        bar_color = theme['danger']
-    
-    fig = go.Figure(go.Indicator(
-        mode="gauge+number",
-        value=overall_score,
-        domain={'x': [0, 1], 'y': [0, 1]},
-        title={'text': "Health Score", 'font': {'size': 16, 'color': theme['text'], 'family': 'Arial'}},
-        number={'font': {'size': 40, 'color': theme['text']}},
-        gauge={
-            'axis': {
-                'range': [None, 100], 
-                'tickcolor': theme['text'],
-                'tickfont': {'color': theme['text'], 'size': 12}
-            },
-            'bar': {'color': bar_color, 'thickness': 0.3},
-            'bgcolor': theme['light_gray'],
-            'borderwidth': 2,
-            'bordercolor': theme['border'],
-            'steps': [
-                {'range': [0, 60], 'color': theme['light_gray']},
-                {'range': [60, 80], 'color': theme['light_gray']},
-                {'range': [80, 100], 'color': theme['light_gray']}
-            ]
-        }
-    ))
+    ring_color = _minimal_score_color(overall_score)
+    circumference = 2 * np.pi * 52
+    filled = circumference * min(max(overall_score, 0), 100) / 100
+    
+    return f"""
+    <div style="text-align: center; margin: 10px 0 20px 0; font-family: Arial;">
+        <svg width="180" height="180" viewBox="0 0 120 120" role="img" aria-label="Health Score {overall_score}">
+            <circle cx="60" cy="60" r="52" fill="none" stroke="{theme['grid']}" stroke-width="10"/>
+            <circle cx="60" cy="60" r="52" fill="none" stroke="{ring_color}" stroke-width="10"
+                    stroke-linecap="round" stroke-dasharray="{filled:.1f} {circumference:.1f}"
+                    transform="rotate(-90 60 60)"/>
+            <text x="60" y="70" text-anchor="middle" font-size="30" fill="{theme['text']}">{overall_score}</text>
+        </svg>
+        <div style="color: {theme['text']}; font-size: 16px;">Health Score</div>
+    </div>
+    """
+
+def _push_stamp_key(metric_type: str) -> str:
+    """Session state key holding the time of the last attempted push for a metric."""
+    return f"_last_push_{metric_type}"
+
+def _is_duplicate_push(metric_type: str) -> bool:
+    """
+    Detect a repeated push submit for the same metric, e.g. from a double click.
     
-    fig.update_layout(
-        paper_bgcolor=theme['bg_color'],
-        plot_bgcolor=theme['bg_color'],
-        font={'color': theme['text'], 'family': 'Arial'},
-        height=250,
-        margin={'l': 20, 'r': 20, 't': 40, 'b': 20}
-    )
+    The submit time is only recorded when a push is about to be attempted;
+    callers drop it again when the push fails so an immediate retry goes through.
     
-    return fig
+    Args:
+        metric_type: Type of metric ('height' or 'weight')
+    
+    Returns:
+        True if the previous attempted push for this metric was within _PUSH_DEBOUNCE_SECONDS
+    """
+    key = _push_stamp_key(metric_type)
+    now = time.monotonic()
+    last_push = st.session_state.get(key)
+    if last_push is not None and now - last_push < _PUSH_DEBOUNCE_SECONDS:
+        return True
+    st.session_state[key] = now
+    return False
+
+# Minimal dashboard card templates, parsed once at import
+_EDITABLE_CARD_TEMPLATE = Template("""
+<div style="background: #ffffff; border: 1px solid #ecf0f1; border-radius: 8px; 
+           padding: 20px; margin: 10px 0; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">
+    <h4><span style="width: 8px; height: 8px; border-radius: 50%; 
+              background-color: $color; display: inline-block; margin-right: 8px;"></span>
+        $title$demo_indicator</h4>
+    <p><strong>Current:</strong> $value $unit</p>
+</div>
+""")
+
+_EDITABLE_CARD_NO_DATA_TEMPLATE = Template("""
+<div style="background: #ffffff; border: 1px solid #ecf0f1; border-radius: 8px; 
+           padding: 20px; margin: 10px 0; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">
+    <h4><span style="width: 8px; height: 8px; border-radius: 50%; 
+              background-color: #f39c12; display: inline-block; margin-right: 8px;"></span>
+        $title</h4>
+    <p><strong>No data available</strong></p>
+</div>
+""")
+
+_BMI_CARD_TEMPLATE = Template("""
+<div style="background: #ffffff; border: 1px solid #ecf0f1; border-radius: 8px; 
+           padding: 20px; margin: 10px 0; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">
+    <h4><span style="width: 8px; height: 8px; border-radius: 50%; 
+              background-color: $color; 
+              display: inline-block; margin-right: 8px;"></span>BMI (Calculated)</h4>
+    <p><strong>Current:</strong> $bmi</p>
+    <p><strong>Category:</strong> $category</p>
+</div>
+""")
+
+_BMI_CARD_DOT_COLORS = {'status-good': '#27ae60', 'status-warning': '#f39c12', 'status-info': '#3498db'}
+
+_BMI_CARD_NO_DATA_HTML = """
+<div style="background: #ffffff; border: 1px solid #ecf0f1; border-radius: 8px; 
+           padding: 20px; margin: 10px 0; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">
+    <h4><span style="width: 8px; height: 8px; border-radius: 50%; 
+              background-color: #f39c12; display: inline-block; margin-right: 8px;"></span>BMI (Calculated)</h4>
+    <p><strong>No height/weight data available</strong></p>
+</div>
+"""
 
+@st.fragment
 def create_editable_metric_card(title: str, current_value: float, unit: str, metric_type: str, 
                                token_manager) -> None:
     """
@@ -470,25 +765,12 @@ def create_editable_metric_card(title: str, current_value: float, unit: str, met
             if display_value:
                 demo_indicator = " (Demo)" if is_demo else ""
                 color = "#e67e22" if is_demo else "#3498db"  # Orange for demo, blue for real
-                st.markdown(f"""
-                <div style="background: #ffffff; border: 1px solid #ecf0f1; border-radius: 8px; 
-                           padding: 20px; margin: 10px 0; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">
-                    <h4><span style="width: 8px; height: 8px; border-radius: 50%; 
-                              background-color: {color}; display: inline-block; margin-right: 8px;"></span>
-                        {title}{demo_indicator}</h4>
-                    <p><strong>Current:</strong> {display_value:.2f} {unit}</p>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(_EDITABLE_CARD_TEMPLATE.substitute(
+                    color=color, title=title, demo_indicator=demo_indicator,
+                    value=f"{display_value:.2f}", unit=unit
+                ), unsafe_allow_html=True)
             else:
-                st.markdown(f"""
-                <div style="background: #ffffff; border: 1px solid #ecf0f1; border-radius: 8px; 
-                           padding: 20px; margin: 10px 0; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">
-                    <h4><span style="width: 8px; height: 8px; border-radius: 50%; 
-                              background-color: #f39c12; display: inline-block; margin-right: 8px;"></span>
-                        {title}</h4>
-                    <p><strong>No data available</strong></p>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(_EDITABLE_CARD_NO_DATA_TEMPLATE.substitute(title=title), unsafe_allow_html=True)
         
         with col2:
             # Change button
@@ -543,7 +825,9 @@ def create_editable_metric_card(title: str, current_value: float, unit: str, met
                             st.session_state[f"demo_{metric_type}_value"] = new_value
                             st.success(f"✅ Demo: {title} updated to {new_value} {unit} (not pushed to gateway)")
                             st.session_state[f"edit_{metric_type}"] = False
-                            st.rerun()
+                            st.rerun(scope="fragment")
+                    elif _is_duplicate_push(metric_type):
+                        st.info(f"{title} was just submitted; ignoring the repeated click.")
                     else:
                         # Real mode: attempt to push to Health Connect Gateway
                         with st.spinner(f"Pushing {title.lower()} data..."):
@@ -551,10 +835,6 @@ def create_editable_metric_card(title: str, current_value: float, unit: str, met
                                 st.write("🔍 **Debug Info**: Attempting to push data to Health Connect Gateway...")
                                 
                                 # Capture stdout to show debug info in UI
-                                import io
-                                import sys
-                                from contextlib import redirect_stdout
-                                
                                 debug_output = io.StringIO()
                                 
                                 with redirect_stdout(debug_output):
@@ -572,15 +852,19 @@ def create_editable_metric_card(title: str, current_value: float, unit: str, met
                                 if success:
                                     st.success(f"✅ {message}")
                                     st.session_state[f"edit_{metric_type}"] = False
-                                    # Force a refresh of the dashboard
+                                    # Force a refresh of the dashboard with the new record
+                                    _cached_health_data.clear()
                                     time.sleep(1)
                                     st.rerun()
                                 else:
                                     st.error(f"❌ {message}")
+                                    # Let an immediate retry through
+                                    st.session_state.pop(_push_stamp_key(metric_type), None)
                                     
                             except Exception as e:
                                 error_msg = str(e)
                                 st.error(f"❌ **Error Details**: {error_msg}")
+                                st.session_state.pop(_push_stamp_key(metric_type), None)
                                 
                                 # Show the debug output even on error
                                 debug_text = debug_output.getvalue() if 'debug_output' in locals() else "No debug output captured"
@@ -590,7 +874,6 @@ def create_editable_metric_card(title: str, current_value: float, unit: str, met
                                     st.text(f"Exception Message: {str(e)}")
                                     
                                     # Show traceback
-                                    import traceback
                                     tb = traceback.format_exc()
                                     st.text(f"\nFull Traceback:\n{tb}")
                                 
@@ -604,67 +887,91 @@ def create_editable_metric_card(title: str, current_value: float, unit: str, met
                 
                 if cancel:
                     st.session_state[f"edit_{metric_type}"] = False
-                    st.rerun()
+                    st.rerun(scope="fragment")
+
+@st.fragment
+def _render_demo_mode_toggle() -> None:
+    """
+    Render the Demo Mode checkbox, dropping stored demo values when it is switched off.
+    
+    The checkbox runs as a fragment: the flag is only read when an edit form is
+    submitted, so toggling it does not rerun the dashboard unless demo values
+    shown on the metric cards have to be cleared.
+    """
+    was_demo = st.session_state.get("demo_mode", False)
+    demo_mode = st.checkbox("🎭 Demo Mode", value=was_demo, help="Enable demo mode to test editing without gateway push")
+    st.session_state["demo_mode"] = demo_mode
+    
+    # Clear demo values only when disabling demo mode
+    if was_demo and not demo_mode:
+        cleared = [st.session_state.pop(key, None) for key in ("demo_height_value", "demo_weight_value")]
+        if any(value is not None for value in cleared):
+            # The metric cards display the demo values, so redraw the whole dashboard
+            st.rerun()
+
+# Static styles for the minimal dashboard, built once at import and
+# injected with st.html, which keeps style-only HTML out of the page layout
+_DASHBOARD_CSS = """
+<style>
+.main-header {
+    text-align: center;
+    color: #2c3e50;
+    font-family: 'Arial', sans-serif;
+    font-size: 2.2em;
+    font-weight: 300;
+    margin-bottom: 40px;
+    letter-spacing: 2px;
+}
+
+.metric-card {
+    background: #ffffff;
+    border: 1px solid #ecf0f1;
+    border-radius: 8px;
+    padding: 20px;
+    margin: 10px 0;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    transition: box-shadow 0.3s ease;
+}
+
+.metric-card:hover {
+    box-shadow: 0 4px 8px rgba(0,0,0,0.15);
+}
+
+.status-indicator {
+    width: 8px;
+    height: 8px;
+    border-radius: 50%;
+    display: inline-block;
+    margin-right: 8px;
+}
+
+.status-good { background-color: #27ae60; }
+.status-warning { background-color: #f39c12; }
+.status-info { background-color: #3498db; }
+
+.section-title {
+    color: #2c3e50;
+    font-size: 1.4em;
+    font-weight: 300;
+    margin: 30px 0 20px 0;
+    border-bottom: 2px solid #ecf0f1;
+    padding-bottom: 10px;
+}
+
+.summary-text {
+    color: #7f8c8d;
+    font-size: 0.9em;
+    text-align: center;
+    margin-top: 30px;
+}
+</style>
+"""
 
 def render_minimal_health_dashboard():
     """
     Render a clean, minimal health dashboard.
     """
-    st.markdown("""
-    <style>
-    .main-header {
-        text-align: center;
-        color: #2c3e50;
-        font-family: 'Arial', sans-serif;
-        font-size: 2.2em;
-        font-weight: 300;
-        margin-bottom: 40px;
-        letter-spacing: 2px;
-    }
-    
-    .metric-card {
-        background: #ffffff;
-        border: 1px solid #ecf0f1;
-        border-radius: 8px;
-        padding: 20px;
-        margin: 10px 0;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        transition: box-shadow 0.3s ease;
-    }
-    
-    .metric-card:hover {
-        box-shadow: 0 4px 8px rgba(0,0,0,0.15);
-    }
-    
-    .status-indicator {
-        width: 8px;
-        height: 8px;
-        border-radius: 50%;
-        display: inline-block;
-        margin-right: 8px;
-    }
-    
-    .status-good { background-color: #27ae60; }
-    .status-warning { background-color: #f39c12; }
-    .status-info { background-color: #3498db; }
-    
-    .section-title {
-        color: #2c3e50;
-        font-size: 1.4em;
-        font-weight: 300;
-        margin: 30px 0 20px 0;
-        border-bottom: 2px solid #ecf0f1;
-        padding-bottom: 10px;
-    }
-    
-    .summary-text {
-        color: #7f8c8d;
-        font-size: 0.9em;
-        text-align: center;
-        margin-top: 30px;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    st.html(_DASHBOARD_CSS)
     
     # Main header
     st.markdown('<h1 class="main-header">Health Dashboard</h1>', unsafe_allow_html=True)
@@ -672,15 +979,7 @@ def render_minimal_health_dashboard():
     # Demo mode toggle
     col1, col2, col3 = st.columns([2, 1, 2])
     with col2:
-        demo_mode = st.session_state.get("demo_mode", False)
-        if st.checkbox("🎭 Demo Mode", value=demo_mode, help="Enable demo mode to test editing without gateway push"):
-            st.session_state["demo_mode"] = True
-        else:
-            st.session_state["demo_mode"] = False
-            # Clear demo values when disabling demo mode
-            for metric in ["height", "weight"]:
-                if f"demo_{metric}_value" in st.session_state:
-                    del st.session_state[f"demo_{metric}_value"]
+        _render_demo_mode_toggle()
     
     # Initialize token manager for push operations
     try:
@@ -693,24 +992,16 @@ def render_minimal_health_dashboard():
     
     # Get comprehensive health data
     try:
-        health_data = get_comprehensive_health_data()
+        health_data = _cached_health_data()
     except Exception as e:
         st.error(f"Error loading health data: {e}")
-        health_data = {
-            'body_composition': {},
-            'vital_signs': {},
-            'fitness': {},
-            'health_score': {'overall': 0}
-        }
+        health_data = _EMPTY_HEALTH_DATA
     
     # Health Score at the top
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
-        st.plotly_chart(
-            create_health_score_gauge(health_data),
-            use_container_width=True,
-            config={'displayModeBar': False}
-        )
+        overall_score = _metric_value(health_data, 'health_score', 'overall', 0)
+        st.markdown(_health_score_ring_html(overall_score), unsafe_allow_html=True)
     
     st.markdown('<div class="section-title">Body Composition Analysis</div>', unsafe_allow_html=True)
     
@@ -722,7 +1013,7 @@ def render_minimal_health_dashboard():
         st.plotly_chart(
             create_body_composition_chart(health_data),
             use_container_width=True,
-            config={'displayModeBar': False}
+            config=_PLOTLY_CONFIG
         )
     
     with col2:
@@ -730,23 +1021,32 @@ def render_minimal_health_dashboard():
         st.plotly_chart(
             create_key_metrics_chart(health_data),
             use_container_width=True,
-            config={'displayModeBar': False}
+            config=_PLOTLY_CONFIG
         )
     
     st.markdown('<div class="section-title">Current Health Metrics</div>', unsafe_allow_html=True)
     
-    # Data summary section with clean cards
+    # Data summary section with clean cards; read every displayed value once
     body_comp = health_data.get('body_composition', {})
     vital_signs = health_data.get('vital_signs', {})
     fitness = health_data.get('fitness', {})
+    bmi_info = body_comp.get('bmi', {})
+    heart_rate = vital_signs.get('heartRate', {})
+    
+    weight = _metric_value(body_comp, 'weight')
+    height = _metric_value(body_comp, 'height')
+    bmi = bmi_info.get('current')
+    bmi_category = bmi_info.get('category', 'N/A')
+    bmr = _metric_value(body_comp, 'basalMetabolicRate')
+    hr = heart_rate.get('current')
+    rhr = heart_rate.get('resting')
+    steps = _metric_value(fitness, 'steps', 'daily_avg')
+    distance = _metric_value(fitness, 'distance', 'daily_avg')
+    calories = _metric_value(fitness, 'calories', 'active')
     
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        weight = body_comp.get('weight', {}).get('current')
-        height = body_comp.get('height', {}).get('current')
-        bmi = body_comp.get('bmi', {}).get('current')
-        
         # Editable Physical Profile Section
         st.markdown('<div class="section-title">Editable Physical Profile</div>', unsafe_allow_html=True)
         
@@ -759,31 +1059,13 @@ def render_minimal_health_dashboard():
         # BMI - Calculated (non-editable)
         if weight and height and bmi:
             status_class = "status-good" if 18.5 <= bmi <= 25 else "status-warning" if bmi <= 30 else "status-info"
-            st.markdown(f"""
-            <div style="background: #ffffff; border: 1px solid #ecf0f1; border-radius: 8px; 
-                       padding: 20px; margin: 10px 0; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">
-                <h4><span style="width: 8px; height: 8px; border-radius: 50%; 
-                          background-color: {'#27ae60' if status_class == 'status-good' else '#f39c12' if status_class == 'status-warning' else '#3498db'}; 
-                          display: inline-block; margin-right: 8px;"></span>BMI (Calculated)</h4>
-                <p><strong>Current:</strong> {bmi:.1f}</p>
-                <p><strong>Category:</strong> {body_comp.get('bmi', {}).get('category', 'N/A')}</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_BMI_CARD_TEMPLATE.substitute(
+                color=_BMI_CARD_DOT_COLORS[status_class], bmi=f"{bmi:.1f}", category=bmi_category
+            ), unsafe_allow_html=True)
         else:
-            st.markdown("""
-            <div style="background: #ffffff; border: 1px solid #ecf0f1; border-radius: 8px; 
-                       padding: 20px; margin: 10px 0; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">
-                <h4><span style="width: 8px; height: 8px; border-radius: 50%; 
-                          background-color: #f39c12; display: inline-block; margin-right: 8px;"></span>BMI (Calculated)</h4>
-                <p><strong>No height/weight data available</strong></p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_BMI_CARD_NO_DATA_HTML, unsafe_allow_html=True)
     
     with col2:
-        bmr = body_comp.get('basalMetabolicRate', {}).get('current')
-        hr = vital_signs.get('heartRate', {}).get('current')
-        rhr = vital_signs.get('heartRate', {}).get('resting')
-        
         if bmr or hr or rhr:
             st.markdown(f"""
             <div class="metric-card">
@@ -795,10 +1077,6 @@ def render_minimal_health_dashboard():
             """, unsafe_allow_html=True)
     
     with col3:
-        steps = fitness.get('steps', {}).get('daily_avg')
-        distance = fitness.get('distance', {}).get('daily_avg')
-        calories = fitness.get('calories', {}).get('active')
-        
         if distance or steps or calories:
             status_class = "status-good" if (steps and steps >= 8000) else "status-warning"
             st.markdown(f"""
@@ -810,237 +1088,364 @@ def render_minimal_health_dashboard():
             </div>
             """, unsafe_allow_html=True)
     
-    # Last update info
+    # Last update info and footer, sent as one element
+    footer = '<p class="summary-text">Health metrics are automatically updated from your connected devices</p>'
     last_updated = health_data.get('generated_at')
     if last_updated:
-        update_time = datetime.fromisoformat(last_updated.replace('Z', '+00:00')).strftime('%B %d, %Y at %H:%M UTC')
-        st.markdown(f'<p class="summary-text">Data last updated on {update_time}</p>', unsafe_allow_html=True)
+        update_time = _format_generated_at(last_updated)
+        footer = f'<p class="summary-text">Data last updated on {update_time}</p>{footer}'
     
-    st.markdown('<p class="summary-text">Health metrics are automatically updated from your connected devices</p>', unsafe_allow_html=True)
+    st.markdown(footer, unsafe_allow_html=True)
 
-def render_hospital_health_dashboard():
-    """
-    Render a hospital-style health dashboard with clean medical aesthetics.
+def _minify_css(css: str) -> str:
     """
-    # DASHBOARD DE SALUD MUY BLANCO Y MINIMALISTA
-    st.markdown("""
-    <style>
-    /* Dashboard de salud muy limpio */
-    .hospital-dashboard {
-        font-family: -apple-system, BlinkMacSystemFont, 'San Francisco', 'Helvetica Neue', 'Inter', sans-serif;
-        color: var(--text-primary);
-        background: #ffffff !important;
-        padding: 2rem;
-        border-radius: 0;
-    }
-    
-    .health-metric-grid {
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-        gap: 1.5rem;
-        margin-bottom: 2rem;
-    }
-    
-    .health-metric-card {
-        background: #ffffff !important;
-        border-radius: 16px;
-        padding: 2rem;
-        border: 1px solid #f3f4f6 !important;
-        box-shadow: 0 1px 3px rgba(0, 0, 0, 0.02) !important;
-        transition: all 0.2s ease;
-        position: relative;
-    }
+    Strip comments and redundant whitespace from a CSS block.
     
-    .health-metric-card:hover {
-        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.04) !important;
-        transform: translateY(-2px);
-        border-color: #e5e7eb !important;
-    }
-    
-    .health-metric-card:focus-within {
-        outline: 2px solid var(--primary-blue);
-        outline-offset: 2px;
-    }
-    
-    .metric-header {
-        display: flex;
-        align-items: center;
-        margin-bottom: 1rem;
-    }
-    
-    .metric-icon {
-        width: 2.5rem;
-        height: 2.5rem;
-        border-radius: 8px;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        margin-right: 0.75rem;
-        font-size: 1.25rem;
-        flex-shrink: 0;
-    }
+    Args:
+        css: CSS source, optionally wrapped in a <style> tag
     
-    .metric-icon.blue { 
-        background: rgba(37, 99, 235, 0.1); 
-        color: var(--primary-blue); 
-        border: 1px solid rgba(37, 99, 235, 0.2);
-    }
-    .metric-icon.green { 
-        background: rgba(16, 185, 129, 0.1); 
-        color: var(--success-green);
-        border: 1px solid rgba(16, 185, 129, 0.2);
-    }
-    .metric-icon.amber { 
-        background: rgba(245, 158, 11, 0.1); 
-        color: var(--warning-amber);
-        border: 1px solid rgba(245, 158, 11, 0.2);
-    }
-    .metric-icon.red { 
-        background: rgba(239, 68, 68, 0.1); 
-        color: var(--danger-red);
-        border: 1px solid rgba(239, 68, 68, 0.2);
-    }
-    
-    .metric-title {
-        font-size: 1rem;
-        font-weight: 600;
-        color: var(--text-primary);
-        margin: 0;
-        line-height: 1.3;
-    }
-    
-    .metric-subtitle {
-        font-size: 0.875rem;
-        color: var(--text-secondary);
-        margin: 0;
-        line-height: 1.4;
-    }
-    
-    .metric-value {
-        font-size: 2.25rem;
-        font-weight: 700;
-        color: var(--text-primary);
-        margin: 0.75rem 0 0.5rem 0;
-        line-height: 1;
-    }
-    
-    .metric-unit {
-        font-size: 0.875rem;
-        color: var(--text-tertiary);
-        font-weight: 500;
-        margin-left: 0.25rem;
-    }
-    
-    .metric-change {
-        font-size: 0.875rem;
-        font-weight: 500;
-        display: flex;
-        align-items: center;
-        margin-top: 0.5rem;
-    }
-    
-    .metric-change.positive { color: var(--success-green); }
-    .metric-change.negative { color: var(--danger-red); }
-    .metric-change.neutral { color: var(--text-tertiary); }
-    
-    .health-status-badge {
-        position: absolute;
-        top: 1rem;
-        right: 1rem;
-        padding: 0.375rem 0.875rem;
-        border-radius: 9999px;
-        font-size: 0.75rem;
-        font-weight: 600;
-        text-transform: uppercase;
-        letter-spacing: 0.025em;
-        border: 1px solid transparent;
-    }
-    
-    .status-excellent { 
-        background: rgba(16, 185, 129, 0.1); 
-        color: var(--success-green);
-        border-color: rgba(16, 185, 129, 0.2);
-    }
-    .status-good { 
-        background: rgba(37, 99, 235, 0.1); 
-        color: var(--primary-blue);
-        border-color: rgba(37, 99, 235, 0.2);
-    }
-    .status-fair { 
-        background: rgba(245, 158, 11, 0.1); 
-        color: var(--warning-amber);
-        border-color: rgba(245, 158, 11, 0.2);
-    }
-    .status-poor { 
-        background: rgba(239, 68, 68, 0.1); 
-        color: var(--danger-red);
-        border-color: rgba(239, 68, 68, 0.2);
-    }
-    
-    .chart-container {
-        background: var(--surface-elevated);
-        border-radius: 12px;
-        padding: 1.5rem;
-        border: 1px solid var(--border-primary);
-        box-shadow: var(--shadow-sm);
-        margin-bottom: 1.5rem;
-        transition: all 0.2s ease;
-    }
-    
-    .chart-container:hover {
-        box-shadow: var(--shadow-md);
-        transform: translateY(-1px);
-    }
-    
-    .chart-title {
-        font-size: 1.25rem;
-        font-weight: 600;
-        color: var(--text-primary);
-        margin: 0 0 1rem 0;
-        display: flex;
-        align-items: center;
-        line-height: 1.3;
-    }
-    
-    .chart-icon {
-        margin-right: 0.75rem;
-        font-size: 1.5rem;
-        color: var(--primary-blue);
-        flex-shrink: 0;
-    }
-    
-    .editable-section {
-        background: var(--bg-tertiary);
-        border-radius: 12px;
-        padding: 1.5rem;
-        border: 2px dashed var(--border-secondary);
-        margin: 1.5rem 0;
-        transition: all 0.2s ease;
-    }
-    
-    .editable-section:hover {
-        border-color: var(--primary-blue);
-        background: rgba(37, 99, 235, 0.02);
-    }
+    Returns:
+        Equivalent CSS with comments removed and whitespace collapsed
+    """
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+    css = re.sub(r'\s+', ' ', css)
+    return re.sub(r'\s*([:;{},])\s*', r'\1', css).strip()
+
+# DASHBOARD DE SALUD MUY BLANCO Y MINIMALISTA
+# Static styles for the hospital dashboard, minified once at import. They are still
+# emitted on every rerun because Streamlit drops elements a rerun does not re-emit.
+_HOSPITAL_CSS = _minify_css("""
+<style>
+/* Dashboard de salud muy limpio */
+.hospital-dashboard {
+    font-family: -apple-system, BlinkMacSystemFont, 'San Francisco', 'Helvetica Neue', 'Inter', sans-serif;
+    color: var(--text-primary);
+    background: #ffffff !important;
+    padding: 2rem;
+    border-radius: 0;
+}
+
+.health-metric-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
+    gap: 1.5rem;
+    margin-bottom: 2rem;
+}
+
+.health-metric-card {
+    background: #ffffff !important;
+    border-radius: 16px;
+    padding: 2rem;
+    border: 1px solid #f3f4f6 !important;
+    box-shadow: 0 1px 3px rgba(0, 0, 0, 0.02) !important;
+    transition: all 0.2s ease;
+    position: relative;
+}
+
+.health-metric-card:hover {
+    box-shadow: 0 4px 12px rgba(0, 0, 0, 0.04) !important;
+    transform: translateY(-2px);
+    border-color: #e5e7eb !important;
+}
+
+.health-metric-card:focus-within {
+    outline: 2px solid var(--primary-blue);
+    outline-offset: 2px;
+}
+
+.metric-header {
+    display: flex;
+    align-items: center;
+    margin-bottom: 1rem;
+}
+
+.metric-icon {
+    width: 2.5rem;
+    height: 2.5rem;
+    border-radius: 8px;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    margin-right: 0.75rem;
+    font-size: 1.25rem;
+    flex-shrink: 0;
+}
+
+.metric-icon.blue { 
+    background: rgba(37, 99, 235, 0.1); 
+    color: var(--primary-blue); 
+    border: 1px solid rgba(37, 99, 235, 0.2);
+}
+.metric-icon.green { 
+    background: rgba(16, 185, 129, 0.1); 
+    color: var(--success-green);
+    border: 1px solid rgba(16, 185, 129, 0.2);
+}
+.metric-icon.amber { 
+    background: rgba(245, 158, 11, 0.1); 
+    color: var(--warning-amber);
+    border: 1px solid rgba(245, 158, 11, 0.2);
+}
+.metric-icon.red { 
+    background: rgba(239, 68, 68, 0.1); 
+    color: var(--danger-red);
+    border: 1px solid rgba(239, 68, 68, 0.2);
+}
+
+.metric-title {
+    font-size: 1rem;
+    font-weight: 600;
+    color: var(--text-primary);
+    margin: 0;
+    line-height: 1.3;
+}
+
+.metric-subtitle {
+    font-size: 0.875rem;
+    color: var(--text-secondary);
+    margin: 0;
+    line-height: 1.4;
+}
+
+.metric-value {
+    font-size: 2.25rem;
+    font-weight: 700;
+    color: var(--text-primary);
+    margin: 0.75rem 0 0.5rem 0;
+    line-height: 1;
+}
+
+.metric-unit {
+    font-size: 0.875rem;
+    color: var(--text-tertiary);
+    font-weight: 500;
+    margin-left: 0.25rem;
+}
+
+.metric-change {
+    font-size: 0.875rem;
+    font-weight: 500;
+    display: flex;
+    align-items: center;
+    margin-top: 0.5rem;
+}
+
+.metric-change.positive { color: var(--success-green); }
+.metric-change.negative { color: var(--danger-red); }
+.metric-change.neutral { color: var(--text-tertiary); }
+
+.health-status-badge {
+    position: absolute;
+    top: 1rem;
+    right: 1rem;
+    padding: 0.375rem 0.875rem;
+    border-radius: 9999px;
+    font-size: 0.75rem;
+    font-weight: 600;
+    text-transform: uppercase;
+    letter-spacing: 0.025em;
+    border: 1px solid transparent;
+}
+
+.status-excellent { 
+    background: rgba(16, 185, 129, 0.1); 
+    color: var(--success-green);
+    border-color: rgba(16, 185, 129, 0.2);
+}
+.status-good { 
+    background: rgba(37, 99, 235, 0.1); 
+    color: var(--primary-blue);
+    border-color: rgba(37, 99, 235, 0.2);
+}
+.status-fair { 
+    background: rgba(245, 158, 11, 0.1); 
+    color: var(--warning-amber);
+    border-color: rgba(245, 158, 11, 0.2);
+}
+.status-poor { 
+    background: rgba(239, 68, 68, 0.1); 
+    color: var(--danger-red);
+    border-color: rgba(239, 68, 68, 0.2);
+}
+
+.chart-container {
+    background: var(--surface-elevated);
+    border-radius: 12px;
+    padding: 1.5rem;
+    border: 1px solid var(--border-primary);
+    box-shadow: var(--shadow-sm);
+    margin-bottom: 1.5rem;
+    transition: all 0.2s ease;
+}
+
+.chart-container:hover {
+    box-shadow: var(--shadow-md);
+    transform: translateY(-1px);
+}
+
+.chart-title {
+    font-size: 1.25rem;
+    font-weight: 600;
+    color: var(--text-primary);
+    margin: 0 0 1rem 0;
+    display: flex;
+    align-items: center;
+    line-height: 1.3;
+}
+
+.chart-icon {
+    margin-right: 0.75rem;
+    font-size: 1.5rem;
+    color: var(--primary-blue);
+    flex-shrink: 0;
+}
+
+.editable-section {
+    background: var(--bg-tertiary);
+    border-radius: 12px;
+    padding: 1.5rem;
+    border: 2px dashed var(--border-secondary);
+    margin: 1.5rem 0;
+    transition: all 0.2s ease;
+}
+
+.editable-section:hover {
+    border-color: var(--primary-blue);
+    background: rgba(37, 99, 235, 0.02);
+}
+
+.editable-title {
+    font-size: 1.125rem;
+    font-weight: 600;
+    color: var(--text-primary);
+    margin: 0 0 1rem 0;
+    display: flex;
+    align-items: center;
+    line-height: 1.3;
+}
+
+.edit-icon {
+    margin-right: 0.75rem;
+    color: var(--primary-blue);
+    font-size: 1.25rem;
+    flex-shrink: 0;
+}
+</style>
+""")
+
+# Static intro of the hospital editable profile section
+_EDITABLE_INTRO_HTML = (
+    '<div class="editable-section">'
+    '<h3 class="editable-title"><span class="edit-icon">✏️</span>Editable Physical Profile</h3>'
+    '<p style="color: #64748b; margin-bottom: 1.5rem;">Update your physical measurements to keep your health data current.</p>'
+    '</div>'
+)
+
+# Hospital metric grid bands: searchsorted bounds and (badge class, icon class) per band.
+# Score and steps bands are lower-inclusive (side='right'), BMI and heart rate bands
+# are upper-inclusive like _BMI_STATUS_BOUNDS
+_SCORE_BOUNDS = np.array([40, 60, 80])
+_SCORE_STYLES = (
+    ("status-poor", "Needs Attention", "red"),
+    ("status-fair", "Fair", "amber"),
+    ("status-good", "Good", "blue"),
+    ("status-excellent", "Excellent", "green"),
+)
+_BMI_CARD_STYLES = (
+    ("status-poor", "red"),
+    ("status-excellent", "green"),
+    ("status-fair", "amber"),
+    ("status-poor", "red"),
+)
+_HR_STATUS_BOUNDS = np.array([np.nextafter(60, -np.inf), 100, 120])
+_HR_CARD_STYLES = _BMI_CARD_STYLES
+_STEPS_BOUNDS = np.array([5000, 7000, 10000])
+_STEPS_CARD_STYLES = (
+    ("status-poor", "red"),
+    ("status-fair", "amber"),
+    ("status-good", "blue"),
+    ("status-excellent", "green"),
+)
+
+def _hospital_card_html(title: str, subtitle: str, icon: str, icon_class: str,
+                        badge: str, status_class: str, value: str, unit: str) -> str:
+    """
+    Build the HTML for one card of the hospital metric grid.
     
-    .editable-title {
-        font-size: 1.125rem;
-        font-weight: 600;
-        color: var(--text-primary);
-        margin: 0 0 1rem 0;
-        display: flex;
-        align-items: center;
-        line-height: 1.3;
-    }
+    Args:
+        title: Card title
+        subtitle: Short description under the title
+        icon: Emoji shown in the card icon
+        icon_class: Color class of the icon ('green', 'blue', 'amber' or 'red')
+        badge: Text of the status badge
+        status_class: CSS class of the status badge
+        value: Formatted metric value
+        unit: Unit shown after the value
     
-    .edit-icon {
-        margin-right: 0.75rem;
-        color: var(--primary-blue);
-        font-size: 1.25rem;
-        flex-shrink: 0;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    Returns:
+        Card HTML on a single line, so cards can be joined into one markdown block
+    """
+    return (
+        f'<div class="health-metric-card">'
+        f'<div class="health-status-badge {status_class}">{badge}</div>'
+        f'<div class="metric-header"><div class="metric-icon {icon_class}">{icon}</div>'
+        f'<div><h3 class="metric-title">{title}</h3><p class="metric-subtitle">{subtitle}</p></div></div>'
+        f'<div class="metric-value">{value}<span class="metric-unit">{unit}</span></div>'
+        f'</div>'
+    )
+
+# Static placeholders for grid cards without data
+_NO_DATA_BMI_HTML = _hospital_card_html("Body Mass Index", "Weight status", "⚖️", "amber",
+                                        "No Data", "status-poor", "--", "kg/m²")
+_NO_DATA_HR_HTML = _hospital_card_html("Resting Heart Rate", "Cardiovascular health", "💓", "amber",
+                                       "No Data", "status-poor", "--", "bpm")
+_NO_DATA_STEPS_HTML = _hospital_card_html("Daily Steps", "Physical activity", "👟", "amber",
+                                          "No Data", "status-poor", "--", "steps")
+
+# Card builders are memoized on their scalar inputs, so reruns with unchanged
+# metrics reuse the finished HTML
+@lru_cache(maxsize=64)
+def _health_score_card(overall_score: int) -> str:
+    """Build the health score card of the hospital metric grid."""
+    status_class, status_text, icon_class = _SCORE_STYLES[int(np.searchsorted(_SCORE_BOUNDS, overall_score, side='right'))]
+    return _hospital_card_html("Health Score", "Overall wellness", "❤️", icon_class,
+                               status_text, status_class, str(overall_score), "/100")
+
+@lru_cache(maxsize=64)
+def _bmi_card(bmi: float, bmi_category: str) -> str:
+    """Build the BMI card of the hospital metric grid."""
+    if not bmi:
+        return _NO_DATA_BMI_HTML
+    
+    bmi_status, bmi_icon = _BMI_CARD_STYLES[int(np.searchsorted(_BMI_STATUS_BOUNDS, bmi))]
+    return _hospital_card_html("Body Mass Index", "Weight status", "⚖️", bmi_icon,
+                               bmi_category, bmi_status, f"{bmi:.1f}", "kg/m²")
+
+@lru_cache(maxsize=64)
+def _hr_card(hr: int) -> str:
+    """Build the resting heart rate card of the hospital metric grid."""
+    if not hr:
+        return _NO_DATA_HR_HTML
+    
+    hr_status, hr_icon = _HR_CARD_STYLES[int(np.searchsorted(_HR_STATUS_BOUNDS, hr))]
+    return _hospital_card_html("Resting Heart Rate", "Cardiovascular health", "💓", hr_icon,
+                               "Normal", hr_status, str(hr), "bpm")
+
+@lru_cache(maxsize=64)
+def _steps_card(steps: float) -> str:
+    """Build the daily steps card of the hospital metric grid."""
+    if not steps:
+        return _NO_DATA_STEPS_HTML
+    
+    steps_status, steps_icon = _STEPS_CARD_STYLES[int(np.searchsorted(_STEPS_BOUNDS, steps, side='right'))]
+    return _hospital_card_html("Daily Steps", "Physical activity", "👟", steps_icon,
+                               "Active", steps_status, f"{steps:,.0f}", "steps")
+
+def render_hospital_health_dashboard():
+    """
+    Render a hospital-style health dashboard with clean medical aesthetics.
+    """
+    st.html(_HOSPITAL_CSS)
     
     # Initialize token manager for push operations
     try:
@@ -1053,251 +1458,80 @@ def render_hospital_health_dashboard():
     
     # Get comprehensive health data
     try:
-        health_data = get_comprehensive_health_data()
+        health_data = _cached_health_data()
     except Exception as e:
         st.error(f"Error loading health data: {e}")
-        health_data = {
-            'body_composition': {},
-            'vital_signs': {},
-            'fitness': {},
-            'health_score': {'overall': 0}
-        }
+        health_data = _EMPTY_HEALTH_DATA
     
     # Demo mode toggle
     _, col2, _ = st.columns([2, 1, 2])
     with col2:
-        demo_mode = st.session_state.get("demo_mode", False)
-        if st.checkbox("🎭 Demo Mode", value=demo_mode, help="Enable demo mode to test editing without gateway push"):
-            st.session_state["demo_mode"] = True
-        else:
-            st.session_state["demo_mode"] = False
-            # Clear demo values when disabling demo mode
-            for metric in ["height", "weight"]:
-                if f"demo_{metric}_value" in st.session_state:
-                    del st.session_state[f"demo_{metric}_value"]
+        _render_demo_mode_toggle()
     
     # Health metrics grid
     st.markdown('<div class="hospital-dashboard">', unsafe_allow_html=True)
     
-    # Extract health data
+    # Extract health data; read every displayed value once
     body_comp = health_data.get('body_composition', {})
     vital_signs = health_data.get('vital_signs', {})
     fitness = health_data.get('fitness', {})
-    health_score = health_data.get('health_score', {})
-    
-    # Key metrics cards
-    st.markdown('<div class="health-metric-grid">', unsafe_allow_html=True)
     
-    # Health Score Card
-    overall_score = health_score.get('overall', 0)
-    if overall_score >= 80:
-        status_class = "status-excellent"
-        status_text = "Excellent"
-        icon_class = "green"
-    elif overall_score >= 60:
-        status_class = "status-good"
-        status_text = "Good"
-        icon_class = "blue"
-    elif overall_score >= 40:
-        status_class = "status-fair"
-        status_text = "Fair"
-        icon_class = "amber"
-    else:
-        status_class = "status-poor"
-        status_text = "Needs Attention"
-        icon_class = "red"
-    
-    st.markdown(f"""
-    <div class="health-metric-card">
-        <div class="health-status-badge {status_class}">{status_text}</div>
-        <div class="metric-header">
-            <div class="metric-icon {icon_class}">❤️</div>
-            <div>
-                <h3 class="metric-title">Health Score</h3>
-                <p class="metric-subtitle">Overall wellness</p>
-            </div>
-        </div>
-        <div class="metric-value">{overall_score}<span class="metric-unit">/100</span></div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # BMI Card
-    bmi = body_comp.get('bmi', {}).get('current', 0)
-    bmi_category = body_comp.get('bmi', {}).get('category', 'Unknown')
-    
-    if bmi:
-        if 18.5 <= bmi <= 25:
-            bmi_status = "status-excellent"
-            bmi_icon = "green"
-        elif 25 < bmi <= 30:
-            bmi_status = "status-fair"
-            bmi_icon = "amber"
-        else:
-            bmi_status = "status-poor"
-            bmi_icon = "red"
-        
-        st.markdown(f"""
-        <div class="health-metric-card">
-            <div class="health-status-badge {bmi_status}">{bmi_category}</div>
-            <div class="metric-header">
-                <div class="metric-icon {bmi_icon}">⚖️</div>
-                <div>
-                    <h3 class="metric-title">Body Mass Index</h3>
-                    <p class="metric-subtitle">Weight status</p>
-                </div>
-            </div>
-            <div class="metric-value">{bmi:.1f}<span class="metric-unit">kg/m²</span></div>
-        </div>
-        """, unsafe_allow_html=True)
-    else:
-        st.markdown("""
-        <div class="health-metric-card">
-            <div class="health-status-badge status-poor">No Data</div>
-            <div class="metric-header">
-                <div class="metric-icon amber">⚖️</div>
-                <div>
-                    <h3 class="metric-title">Body Mass Index</h3>
-                    <p class="metric-subtitle">Weight status</p>
-                </div>
-            </div>
-            <div class="metric-value">--<span class="metric-unit">kg/m²</span></div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Heart Rate Card
-    hr = vital_signs.get('heartRate', {}).get('resting', 0)
-    if hr:
-        if 60 <= hr <= 100:
-            hr_status = "status-excellent"
-            hr_icon = "green"
-        elif 100 < hr <= 120:
-            hr_status = "status-fair"
-            hr_icon = "amber"
-        else:
-            hr_status = "status-poor"
-            hr_icon = "red"
-        
-        st.markdown(f"""
-        <div class="health-metric-card">
-            <div class="health-status-badge {hr_status}">Normal</div>
-            <div class="metric-header">
-                <div class="metric-icon {hr_icon}">💓</div>
-                <div>
-                    <h3 class="metric-title">Resting Heart Rate</h3>
-                    <p class="metric-subtitle">Cardiovascular health</p>
-                </div>
-            </div>
-            <div class="metric-value">{hr}<span class="metric-unit">bpm</span></div>
-        </div>
-        """, unsafe_allow_html=True)
-    else:
-        st.markdown("""
-        <div class="health-metric-card">
-            <div class="health-status-badge status-poor">No Data</div>
-            <div class="metric-header">
-                <div class="metric-icon amber">💓</div>
-                <div>
-                    <h3 class="metric-title">Resting Heart Rate</h3>
-                    <p class="metric-subtitle">Cardiovascular health</p>
-                </div>
-            </div>
-            <div class="metric-value">--<span class="metric-unit">bpm</span></div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Daily Steps Card
-    steps = fitness.get('steps', {}).get('daily_avg', 0)
-    if steps:
-        if steps >= 10000:
-            steps_status = "status-excellent"
-            steps_icon = "green"
-        elif steps >= 7000:
-            steps_status = "status-good"
-            steps_icon = "blue"
-        elif steps >= 5000:
-            steps_status = "status-fair"
-            steps_icon = "amber"
-        else:
-            steps_status = "status-poor"
-            steps_icon = "red"
-        
-        st.markdown(f"""
-        <div class="health-metric-card">
-            <div class="health-status-badge {steps_status}">Active</div>
-            <div class="metric-header">
-                <div class="metric-icon {steps_icon}">👟</div>
-                <div>
-                    <h3 class="metric-title">Daily Steps</h3>
-                    <p class="metric-subtitle">Physical activity</p>
-                </div>
-            </div>
-            <div class="metric-value">{steps:,.0f}<span class="metric-unit">steps</span></div>
-        </div>
-        """, unsafe_allow_html=True)
-    else:
-        st.markdown("""
-        <div class="health-metric-card">
-            <div class="health-status-badge status-poor">No Data</div>
-            <div class="metric-header">
-                <div class="metric-icon amber">👟</div>
-                <div>
-                    <h3 class="metric-title">Daily Steps</h3>
-                    <p class="metric-subtitle">Physical activity</p>
-                </div>
-            </div>
-            <div class="metric-value">--<span class="metric-unit">steps</span></div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    st.markdown('</div>', unsafe_allow_html=True)  # Close health-metric-grid
+    overall_score = _metric_value(health_data, 'health_score', 'overall', 0)
+    bmi = _metric_value(body_comp, 'bmi', 'current', 0)
+    bmi_category = _metric_value(body_comp, 'bmi', 'category', 'Unknown')
+    hr = _metric_value(vital_signs, 'heartRate', 'resting', 0)
+    steps = _metric_value(fitness, 'steps', 'daily_avg', 0)
+    height = _metric_value(body_comp, 'height')
+    weight = _metric_value(body_comp, 'weight')
+    
+    # Key metrics cards, sent as one markdown element so the grid wraps them
+    grid = [
+        '<div class="health-metric-grid">',
+        _health_score_card(overall_score),
+        _bmi_card(bmi, bmi_category),
+        _hr_card(hr),
+        _steps_card(steps),
+        '</div>',
+    ]
+    st.markdown(''.join(grid), unsafe_allow_html=True)
     
     # Editable Physical Profile Section
-    st.markdown("""
-    <div class="editable-section">
-        <h3 class="editable-title"><span class="edit-icon">✏️</span>Editable Physical Profile</h3>
-        <p style="color: #64748b; margin-bottom: 1.5rem;">Update your physical measurements to keep your health data current.</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_EDITABLE_INTRO_HTML, unsafe_allow_html=True)
     
     # Editable metrics
     col1, col2 = st.columns(2)
     
     with col1:
-        height = body_comp.get('height', {}).get('current')
         create_hospital_metric_card("Height", height, "m", "height", token_manager)
     
     with col2:
-        weight = body_comp.get('weight', {}).get('current')
         create_hospital_metric_card("Weight", weight, "kg", "weight", token_manager)
     
     # Charts section
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown('<div class="chart-container">', unsafe_allow_html=True)
-        st.markdown('<h3 class="chart-title"><span class="chart-icon">📊</span>BMI Analysis</h3>', unsafe_allow_html=True)
+        st.markdown('<div class="chart-container"><h3 class="chart-title"><span class="chart-icon">📊</span>BMI Analysis</h3>', unsafe_allow_html=True)
         fig_bmi = create_hospital_bmi_chart(health_data)
-        st.plotly_chart(fig_bmi, use_container_width=True, config={'displayModeBar': False})
+        st.plotly_chart(fig_bmi, use_container_width=True, config=_PLOTLY_CONFIG)
         st.markdown('</div>', unsafe_allow_html=True)
     
     with col2:
-        st.markdown('<div class="chart-container">', unsafe_allow_html=True)
-        st.markdown('<h3 class="chart-title"><span class="chart-icon">📈</span>Key Metrics</h3>', unsafe_allow_html=True)
+        st.markdown('<div class="chart-container"><h3 class="chart-title"><span class="chart-icon">📈</span>Key Metrics</h3>', unsafe_allow_html=True)
         fig_metrics = create_hospital_metrics_chart(health_data)
-        st.plotly_chart(fig_metrics, use_container_width=True, config={'displayModeBar': False})
+        st.plotly_chart(fig_metrics, use_container_width=True, config=_PLOTLY_CONFIG)
         st.markdown('</div>', unsafe_allow_html=True)
     
     # Health Score Gauge
-    st.markdown('<div class="chart-container">', unsafe_allow_html=True)
-    st.markdown('<h3 class="chart-title"><span class="chart-icon">🎯</span>Overall Health Score</h3>', unsafe_allow_html=True)
+    st.markdown('<div class="chart-container"><h3 class="chart-title"><span class="chart-icon">🎯</span>Overall Health Score</h3>', unsafe_allow_html=True)
     fig_gauge = create_hospital_health_gauge(health_data)
-    st.plotly_chart(fig_gauge, use_container_width=True, config={'displayModeBar': False})
+    st.plotly_chart(fig_gauge, use_container_width=True, config=_PLOTLY_CONFIG)
     st.markdown('</div>', unsafe_allow_html=True)
     
     # Last update info
     last_updated = health_data.get('generated_at')
     if last_updated:
-        update_time = datetime.fromisoformat(last_updated.replace('Z', '+00:00')).strftime('%B %d, %Y at %H:%M UTC')
+        update_time = _format_generated_at(last_updated)
         st.markdown(f"""
         <div style="text-align: center; color: #64748b; font-size: 0.875rem; margin-top: 2rem; padding: 1rem; background: #f8fafc; border-radius: 8px;">
             <p style="margin: 0;">Health data last updated on {update_time}</p>
@@ -1307,6 +1541,60 @@ def render_hospital_health_dashboard():
     
     st.markdown('</div>', unsafe_allow_html=True)  # Close hospital-dashboard
 
+@lru_cache(maxsize=64)
+def _hospital_measurement_card(title: str, unit: str, display_value: Optional[float], is_demo: bool) -> str:
+    """
+    Build the HTML of an editable hospital measurement card, memoized per value.
+    
+    Args:
+        title: Display title for the metric
+        unit: Unit of measurement
+        display_value: Value to display, demo value first
+        is_demo: Whether display_value comes from demo mode
+    
+    Returns:
+        HTML snippet to render with st.markdown
+    """
+    if not display_value:
+        return f"""
+        <div class="health-metric-card" style="margin-bottom: 1rem;">
+            <div class="metric-header">
+                <div class="metric-icon amber">📏</div>
+                <div>
+                    <h3 class="metric-title">{title}</h3>
+                    <p class="metric-subtitle">Physical measurement</p>
+                </div>
+            </div>
+            <div class="metric-value">--<span class="metric-unit">{unit}</span></div>
+            <div style="display: flex; align-items: center; margin-top: 0.5rem;">
+                <span class="status-dot" style="background-color: #f59e0b;"></span>
+                <span style="color: #64748b; font-size: 0.875rem;">No data available</span>
+            </div>
+        </div>
+        """
+    
+    demo_indicator = " (Demo)" if is_demo else ""
+    status_color = "#f59e0b" if is_demo else "#2563eb"  # Amber for demo, blue for real
+    return f"""
+    <div class="health-metric-card" style="margin-bottom: 1rem;">
+        <div class="metric-header">
+            <div class="metric-icon blue">📏</div>
+            <div>
+                <h3 class="metric-title">{title}{demo_indicator}</h3>
+                <p class="metric-subtitle">Physical measurement</p>
+            </div>
+        </div>
+        <div class="metric-value">{display_value:.2f}<span class="metric-unit">{unit}</span></div>
+        <div style="display: flex; align-items: center; margin-top: 0.5rem;">
+            <span class="status-dot" style="background-color: {status_color};"></span>
+            <span style="color: #64748b; font-size: 0.875rem;">
+                {'Demo data' if is_demo else 'Current measurement'}
+            </span>
+        </div>
+    </div>
+    """
+
+@st.fragment
 def create_hospital_metric_card(title: str, current_value: float, unit: str, metric_type: str, 
                                token_manager) -> None:
     """
@@ -1320,77 +1608,40 @@ def create_hospital_metric_card(title: str, current_value: float, unit: str, met
         token_manager: Token manager for API calls
     """
     
+    demo_key = f"demo_{metric_type}_value"
+    edit_key = f"edit_{metric_type}"
+    
     # Create container for the metric
     with st.container():
         col1, col2 = st.columns([3, 1])
         
         with col1:
             # Check for demo value first, then current value
-            demo_value = st.session_state.get(f"demo_{metric_type}_value")
+            demo_value = st.session_state.get(demo_key)
             display_value = demo_value if demo_value is not None else current_value
             is_demo = demo_value is not None
             
             # Display current value with hospital styling
-            if display_value:
-                demo_indicator = " (Demo)" if is_demo else ""
-                status_color = "#f59e0b" if is_demo else "#2563eb"  # Amber for demo, blue for real
-                st.markdown(f"""
-                <div class="health-metric-card" style="margin-bottom: 1rem;">
-                    <div class="metric-header">
-                        <div class="metric-icon blue">📏</div>
-                        <div>
-                            <h3 class="metric-title">{title}{demo_indicator}</h3>
-                            <p class="metric-subtitle">Physical measurement</p>
-                        </div>
-                    </div>
-                    <div class="metric-value">{display_value:.2f}<span class="metric-unit">{unit}</span></div>
-                    <div style="display: flex; align-items: center; margin-top: 0.5rem;">
-                        <span class="status-dot" style="background-color: {status_color};"></span>
-                        <span style="color: #64748b; font-size: 0.875rem;">
-                            {'Demo data' if is_demo else 'Current measurement'}
-                        </span>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-            else:
-                st.markdown(f"""
-                <div class="health-metric-card" style="margin-bottom: 1rem;">
-                    <div class="metric-header">
-                        <div class="metric-icon amber">📏</div>
-                        <div>
-                            <h3 class="metric-title">{title}</h3>
-                            <p class="metric-subtitle">Physical measurement</p>
-                        </div>
-                    </div>
-                    <div class="metric-value">--<span class="metric-unit">{unit}</span></div>
-                    <div style="display: flex; align-items: center; margin-top: 0.5rem;">
-                        <span class="status-dot" style="background-color: #f59e0b;"></span>
-                        <span style="color: #64748b; font-size: 0.875rem;">No data available</span>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+            st.markdown(_hospital_measurement_card(title, unit, display_value, is_demo), unsafe_allow_html=True)
         
         with col2:
             # Change button
             if st.button("✏️ Edit", key=f"change_{metric_type}", 
                         help=f"Update {title.lower()}", type="secondary"):
-                st.session_state[f"edit_{metric_type}"] = True
+                st.session_state[edit_key] = True
         
         # Show edit form if button was clicked
-        if st.session_state.get(f"edit_{metric_type}", False):
+        if st.session_state.get(edit_key, False):
             with st.form(f"edit_{metric_type}_form"):
                 st.markdown(f"**Update {title}**")
                 
-                # Input field with appropriate range and step
-                demo_value = st.session_state.get(f"demo_{metric_type}_value")
-                default_value = demo_value if demo_value is not None else current_value
-                
+                # Input field with appropriate range and step, starting from the displayed value
                 if metric_type == "height":
                     new_value = st.number_input(
                         f"New {title} ({unit})",
                         min_value=0.5,
                         max_value=2.5,
-                        value=default_value if default_value else 1.70,
+                        value=display_value if display_value else 1.70,
                         step=0.01,
                         format="%.2f"
                     )
@@ -1399,7 +1650,7 @@ def create_hospital_metric_card(title: str, current_value: float, unit: str, met
                         f"New {title} ({unit})",
                         min_value=20.0,
                         max_value=300.0,
-                        value=default_value if default_value else 70.0,
+                        value=display_value if display_value else 70.0,
                         step=0.1,
                         format="%.1f"
                     )
@@ -1415,14 +1666,14 @@ def create_hospital_metric_card(title: str, current_value: float, unit: str, met
                     demo_mode = st.session_state.get("demo_mode", False)
                     
                     if demo_mode:
-                        # Demo mode: simulate successful push
-                        with st.spinner(f"Simulating {title.lower()} data push..."):
-                            time.sleep(1)  # Simulate network delay
-                            # Store the new value in session state for display
-                            st.session_state[f"demo_{metric_type}_value"] = new_value
-                            st.success(f"✅ Demo: {title} updated to {new_value} {unit} (not pushed to gateway)")
-                            st.session_state[f"edit_{metric_type}"] = False
-                            st.rerun()
+                        # Demo mode: store the new value in session state for display;
+                        # a toast survives the rerun, unlike st.success
+                        st.session_state[demo_key] = new_value
+                        st.toast(f"✅ Demo: {title} updated to {new_value} {unit} (not pushed to gateway)")
+                        st.session_state[edit_key] = False
+                        st.rerun(scope="fragment")
+                    elif _is_duplicate_push(metric_type):
+                        st.info(f"{title} was just submitted; ignoring the repeated click.")
                     else:
                         # Real mode: attempt to push to Health Connect Gateway
                         with st.spinner(f"Pushing {title.lower()} data..."):
@@ -1433,16 +1684,20 @@ def create_hospital_metric_card(title: str, current_value: float, unit: str, met
                                     success, message = push_weight_data(new_value, token_manager)
                                 
                                 if success:
-                                    st.success(f"✅ {message}")
-                                    st.session_state[f"edit_{metric_type}"] = False
-                                    time.sleep(1)
+                                    st.toast(f"✅ {message}")
+                                    st.session_state[edit_key] = False
+                                    # Force a refresh of the dashboard with the new record
+                                    _cached_health_data.clear()
                                     st.rerun()
                                 else:
                                     st.error(f"❌ {message}")
+                                    # Let an immediate retry through
+                                    st.session_state.pop(_push_stamp_key(metric_type), None)
                                     
                             except Exception as e:
                                 error_msg = str(e)
                                 st.error(f"❌ **Error**: {error_msg}")
+                                st.session_state.pop(_push_stamp_key(metric_type), None)
                                 
                                 # Offer demo mode if FCM token error is detected
                                 if "fcm token" in error_msg.lower() or "push functionality requires" in error_msg.lower():
@@ -1453,8 +1708,8 @@ def create_hospital_metric_card(title: str, current_value: float, unit: str, met
                                         st.rerun()
                 
                 if cancel:
-                    st.session_state[f"edit_{metric_type}"] = False
-                    st.rerun()
+                    st.session_state[edit_key] = False
+                    st.rerun(scope="fragment")
 
 def create_hospital_bmi_chart(health_data: Dict[str, Any]) -> go.Figure:
     """
@@ -1466,88 +1721,67 @@ def create_hospital_bmi_chart(health_data: Dict[str, Any]) -> go.Figure:
     Returns:
         Plotly figure with BMI analysis
     """
-    theme = create_hospital_theme()
     body_comp = health_data.get('body_composition', {})
+    return _hospital_bmi_figure(_metric_value(body_comp, 'bmi', 'current', 0))
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _hospital_bmi_figure(bmi: float) -> go.Figure:
+    """
+    Build the hospital BMI figure, cached per BMI value.
     
-    fig = go.Figure()
-    
-    # BMI visualization
-    bmi = body_comp.get('bmi', {}).get('current', 0)
+    Args:
+        bmi: Current BMI, 0 if unknown
     
-    if bmi > 0:
-        # BMI categories visualization
-        categories = ['Underweight', 'Normal', 'Overweight', 'Obese']
-        ranges = [18.5, 25, 30, 40]
-        colors = [theme['warning'], theme['success'], theme['warning'], theme['danger']]
-        
-        # Determine current category
-        current_category = 0
-        if bmi >= 30:
-            current_category = 3
-        elif bmi >= 25:
-            current_category = 2
-        elif bmi >= 18.5:
-            current_category = 1
-        
-        # Create horizontal bar chart for BMI ranges
-        fig.add_trace(go.Bar(
-            y=categories,
-            x=ranges,
-            orientation='h',
-            marker={
-                'color': [colors[i] if i == current_category else theme['light_gray'] for i in range(len(categories))],
+    Returns:
+        Plotly figure with BMI analysis
+    """
+    theme = create_hospital_theme()
+    layout = _make_hospital_bmi_layout()
+    
+    if bmi <= 0:
+        return go.Figure(layout=layout)
+    
+    # Determine current category and highlight only its bar
+    current_category = int(np.searchsorted(_BMI_BOUNDS, bmi, side='right'))
+    
+    # Horizontal bar chart for BMI ranges, with the current BMI marked by a
+    # dashed line and an annotation; everything is passed at construction
+    return go.Figure(
+        data=[{
+            'type': 'bar',
+            'y': _BMI_CATEGORIES,
+            'x': _BMI_RANGES,
+            'orientation': 'h',
+            'marker': {
+                'color': _HOSPITAL_BMI_BAR_COLORS[current_category],
                 'line': {'color': theme['border'], 'width': 1}
             },
-            text=[f'{r}' for r in ranges],
-            textposition='inside',
-            name='BMI Ranges',
-            textfont={'color': 'white', 'size': 12, 'family': '-apple-system, BlinkMacSystemFont, sans-serif'}
-        ))
-        
-        # Add current BMI indicator
-        fig.add_shape(
-            type="line",
-            x0=bmi, x1=bmi,
-            y0=-0.5, y1=3.5,
-            line={'color': theme['text'], 'width': 3, 'dash': "dash"},
-        )
-        
-        fig.add_annotation(
-            x=bmi,
-            y=3.7,
-            text=f"Your BMI: {bmi:.1f}",
-            showarrow=True,
-            arrowhead=2,
-            arrowsize=1,
-            arrowwidth=2,
-            arrowcolor=theme['text'],
-            font={'size': 14, 'color': theme['text'], 'family': '-apple-system, BlinkMacSystemFont, sans-serif'}
-        )
-    
-    fig.update_layout(
-        paper_bgcolor=theme['bg_color'],
-        plot_bgcolor=theme['bg_color'],
-        font={'color': theme['text'], 'family': '-apple-system, BlinkMacSystemFont, sans-serif'},
-        showlegend=False,
-        height=250,
-        margin={'l': 80, 'r': 20, 't': 20, 'b': 40}
-    )
-    
-    fig.update_xaxes(
-        gridcolor=theme['grid'],
-        tickcolor=theme['text'],
-        title_font={'color': theme['text']},
-        tickfont={'color': theme['text']},
-        range=[15, 35]
-    )
-    
-    fig.update_yaxes(
-        tickcolor=theme['text'],
-        title_font={'color': theme['text']},
-        tickfont={'color': theme['text']}
+            'text': _BMI_RANGE_TEXT,
+            'textposition': 'inside',
+            'name': 'BMI Ranges',
+            'textfont': {'color': 'white'}
+        }],
+        layout={
+            **layout,
+            'shapes': [{
+                'type': 'line',
+                'x0': bmi, 'x1': bmi,
+                'y0': -0.5, 'y1': 3.5,
+                'line': {'color': theme['text'], 'width': 3, 'dash': 'dash'}
+            }],
+            'annotations': [{
+                'x': bmi,
+                'y': 3.7,
+                'text': f"Your BMI: {bmi:.1f}",
+                'showarrow': True,
+                'arrowhead': 2,
+                'arrowsize': 1,
+                'arrowwidth': 2,
+                'arrowcolor': theme['text'],
+                'font': {'size': 14}
+            }]
+        }
     )
-    
-    return fig
 
 def create_hospital_metrics_chart(health_data: Dict[str, Any]) -> go.Figure:
     """
@@ -1559,98 +1793,52 @@ def create_hospital_metrics_chart(health_data: Dict[str, Any]) -> go.Figure:
     Returns:
         Plotly metrics chart figure
     """
-    theme = create_hospital_theme()
     body_comp = health_data.get('body_composition', {})
     fitness = health_data.get('fitness', {})
     
-    # Prepare data for metrics
-    metrics = []
-    values = []
-    colors = []
-    
-    # Weight
-    weight = body_comp.get('weight', {}).get('current')
-    if weight:
-        metrics.append('Weight')
-        values.append(weight)
-        colors.append(theme['primary'])
-    
-    # BMI
-    bmi = body_comp.get('bmi', {}).get('current')
-    if bmi:
-        metrics.append('BMI')
-        values.append(bmi)
-        # Color based on BMI category
-        if 18.5 <= bmi <= 25:
-            colors.append(theme['success'])
-        elif 25 < bmi <= 30:
-            colors.append(theme['warning'])
-        else:
-            colors.append(theme['danger'])
-    
-    # BMR (scaled down for visualization)
-    bmr = body_comp.get('basalMetabolicRate', {}).get('current')
-    if bmr:
-        metrics.append('BMR/100')
-        values.append(bmr / 100)  # Scale down for better visualization
-        colors.append(theme['secondary'])
-    
-    # Distance
-    distance = fitness.get('distance', {}).get('daily_avg')
-    if distance:
-        metrics.append('Distance (km)')
-        values.append(distance)
-        colors.append(theme['accent'])
-    
-    if not metrics:
-        # Return empty figure if no data
-        fig = go.Figure()
-        fig.update_layout(
-            paper_bgcolor=theme['bg_color'],
-            plot_bgcolor=theme['bg_color'],
-            font={'color': theme['text'], 'family': '-apple-system, BlinkMacSystemFont, sans-serif'},
-            height=250
-        )
-        return fig
-    
-    # Create bar chart
-    fig = go.Figure(data=[
-        go.Bar(
-            x=metrics,
-            y=values,
-            marker={
-                'color': colors,
-                'line': {'color': theme['border'], 'width': 1}
-            },
-            text=[f'{v:.1f}' for v in values],
-            textposition='outside',
-            textfont={'color': theme['text'], 'size': 12, 'family': '-apple-system, BlinkMacSystemFont, sans-serif'}
-        )
-    ])
-    
-    fig.update_layout(
-        paper_bgcolor=theme['bg_color'],
-        plot_bgcolor=theme['bg_color'],
-        font={'color': theme['text'], 'family': '-apple-system, BlinkMacSystemFont, sans-serif'},
-        showlegend=False,
-        height=250,
-        margin={'l': 40, 'r': 40, 't': 20, 'b': 40}
+    values = (
+        _metric_value(body_comp, 'weight'),
+        _metric_value(body_comp, 'bmi'),
+        _metric_value(body_comp, 'basalMetabolicRate'),
+        _metric_value(fitness, 'distance', 'daily_avg')
     )
+    if not any(values):
+        return _make_empty_hospital_figure()
     
-    fig.update_xaxes(
-        tickcolor=theme['text'],
-        title_font={'color': theme['text']},
-        tickfont={'color': theme['text'], 'size': 11}
-    )
+    return _hospital_metrics_figure(*values)
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _hospital_metrics_figure(weight: Optional[float], bmi: Optional[float],
+                             bmr: Optional[float], distance: Optional[float]) -> go.Figure:
+    """
+    Build the hospital metrics chart, cached per metric values.
     
-    fig.update_yaxes(
-        gridcolor=theme['grid'],
-        tickcolor=theme['text'],
-        title_font={'color': theme['text']},
-        tickfont={'color': theme['text']}
-    )
+    Args:
+        weight: Current weight in kg
+        bmi: Current BMI
+        bmr: Current basal metabolic rate in kcal/day
+        distance: Average daily distance in km
     
-    return fig
+    Returns:
+        Plotly metrics chart figure
+    """
+    theme = create_hospital_theme()
+    
+    # Prepare data for metrics
+    metrics, values, colors = _key_metric_bars(weight, bmi, bmr, distance, theme)
+    
+    # Create bar chart; a plain trace dict and the layout are validated once, by the figure
+    return go.Figure(data=[{
+        'type': 'bar',
+        'x': metrics,
+        'y': values,
+        'marker': {
+            'color': colors,
+            'line': {'color': theme['border'], 'width': 1}
+        },
+        'texttemplate': '%{y:.1f}',
+        'textposition': 'outside'
+    }], layout=_make_hospital_metrics_layout())
 
 def create_hospital_health_gauge(health_data: Dict[str, Any]) -> go.Figure:
     """
@@ -1659,53 +1847,40 @@ def create_hospital_health_gauge(health_data: Dict[str, Any]) -> go.Figure:
     Args:
         health_data: Health data dictionary
     
+    Returns:
+        Plotly gauge figure
+    """
+    return _hospital_health_gauge_figure(_metric_value(health_data, 'health_score', 'overall', 0))
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _hospital_health_gauge_figure(overall_score: int) -> go.Figure:
+    """
+    Build the hospital health score gauge, cached per score.
+    
+    Args:
+        overall_score: Overall health score (0-100)
+    
     Returns:
         Plotly gauge figure
     """
     theme = create_hospital_theme()
-    health_score = health_data.get('health_score', {})
-    overall_score = health_score.get('overall', 0)
     
-    # Determine color based on score
-    if overall_score >= 80:
-        bar_color = theme['success']
-    elif overall_score >= 60:
-        bar_color = theme['primary']
-    elif overall_score >= 40:
-        bar_color = theme['warning']
-    else:
-        bar_color = theme['danger']
-    
-    fig = go.Figure(go.Indicator(
-        mode="gauge+number",
-        value=overall_score,
-        domain={'x': [0, 1], 'y': [0, 1]},
-        number={'font': {'size': 40, 'color': theme['text'], 'family': '-apple-system, BlinkMacSystemFont, sans-serif'}},
-        gauge={
-            'axis': {
-                'range': [None, 100], 
-                'tickcolor': theme['text'],
-                'tickfont': {'color': theme['text'], 'size': 12, 'family': '-apple-system, BlinkMacSystemFont, sans-serif'}
-            },
+    # Determine color based on score, banded like the health score card
+    bar_color = _HOSPITAL_GAUGE_COLORS[int(np.searchsorted(_SCORE_BOUNDS, overall_score, side='right'))]
+    
+    # Plain trace dict and layout: validated once, by the figure
+    return go.Figure(data=[{
+        'type': 'indicator',
+        'mode': "gauge+number",
+        'value': overall_score,
+        'domain': {'x': [0, 1], 'y': [0, 1]},
+        'number': {'font': {'size': 40}},
+        'gauge': {
+            'axis': {'range': [None, 100], 'tickcolor': theme['text']},
             'bar': {'color': bar_color, 'thickness': 0.3},
             'bgcolor': theme['light_gray'],
             'borderwidth': 2,
             'bordercolor': theme['border'],
-            'steps': [
-                {'range': [0, 40], 'color': theme['light_gray']},
-                {'range': [40, 60], 'color': theme['light_gray']},
-                {'range': [60, 80], 'color': theme['light_gray']},
-                {'range': [80, 100], 'color': theme['light_gray']}
-            ]
+            'steps': _HOSPITAL_GAUGE_STEPS
         }
-    ))
-    
-    fig.update_layout(
-        paper_bgcolor=theme['bg_color'],
-        plot_bgcolor=theme['bg_color'],
-        font={'color': theme['text'], 'family': '-apple-system, BlinkMacSystemFont, sans-serif'},
-        height=300,
-        margin={'l': 20, 'r': 20, 't': 20, 'b': 20}
-    )
-    
-    return fig
+    }], layout=_make_hospital_gauge_layout())